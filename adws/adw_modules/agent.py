@@ -3,6 +3,7 @@
 Uses Claude Code CLI which uses your Max plan credits (not API credits).
 """
 
+import asyncio
 import subprocess
 import sys
 import os
@@ -10,6 +11,8 @@ import json
 import re
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, List, Dict, Any, Tuple, Final
 from dotenv import load_dotenv
 from .data_types import (
@@ -22,12 +25,84 @@ from .data_types import (
     RetryCode,
 )
 
+# orjson is optional - parses stream-json lines a few times faster than
+# the stdlib when installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # Load environment variables
 load_dotenv()
 
 # Get Claude Code CLI path from environment
 CLAUDE_PATH = os.getenv("CLAUDE_CODE_PATH", "claude")
 
+# Cap on concurrently running Claude Code subprocesses. Orchestrators can
+# asyncio.gather many execute_template_async calls; the semaphore keeps the
+# number of live CLI processes bounded.
+MAX_CONCURRENT_AGENTS: Final[int] = int(os.getenv("ADW_MAX_CONCURRENT_AGENTS", "4"))
+
+
+def _get_agent_semaphore() -> asyncio.Semaphore:
+    """Concurrency cap for the running loop.
+
+    Stored on the loop object rather than a module global because a
+    semaphore binds to the first loop that blocks on it, and the sync
+    wrappers asyncio.run a fresh loop per call - a shared instance would
+    raise 'bound to a different event loop' under contention. Each loop
+    is capped independently; the sync wrappers run one call per loop, so
+    gathering orchestrators are the only real contenders.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return loop._adw_agent_semaphore
+    except AttributeError:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_AGENTS)
+        loop._adw_agent_semaphore = semaphore
+        return semaphore
+
+# Hard ceiling on a single Claude Code invocation; timed-out processes
+# are killed and reaped so they can't accumulate as orphans.
+CLAUDE_TIMEOUT_S: Final[int] = int(os.getenv("ADW_CLAUDE_TIMEOUT", "1800"))
+
+# Per-line buffer for the CLI's stream-json stdout. asyncio's default
+# 64 KiB limit makes readline() raise on any tool_use/tool_result frame
+# embedding a large file; stream-json lines are single JSON messages, so
+# 32 MiB comfortably covers the largest frames the CLI emits.
+STREAM_LIMIT_BYTES: Final[int] = 32 * 1024 * 1024
+
+# Backoff schedule for retryable Claude Code errors. Transient failures
+# (empty stream, brief rate-limit) usually clear immediately, so the first
+# retry waits only half a second.
+DEFAULT_RETRY_DELAYS: Final[Tuple[float, ...]] = (0.5, 2, 4, 8, 16)
+
+# Matches the leading slash command of a prompt, e.g. "/implement".
+_SLASH_CMD_RE: Final = re.compile(r"^(/\w+)")
+
+# Resolved once at import; the repo doesn't move mid-process.
+_PROJECT_ROOT: Final[str] = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+_AGENTS_DIR: Final[str] = os.path.join(_PROJECT_ROOT, "agents")
+
+# Directories already created this process; agents share the same
+# agents/{adw_id}/{agent_name} directories across many calls.
+_ensured_dirs: set = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """os.makedirs(exist_ok=True), skipping paths already created."""
+    if path in _ensured_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ensured_dirs.add(path)
+
+
+# Single worker keeps prompt-log writes ordered per workflow while moving
+# them off the critical path before the Claude CLI spawn.
+_LOG_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="adw-log")
+
 # Model selection mapping for slash commands
 SLASH_COMMAND_MODEL_MAP: Final[Dict[SlashCommand, Dict[ModelSet, str]]] = {
     "/classify_issue": {"base": "sonnet", "heavy": "sonnet"},
@@ -51,6 +126,21 @@ SLASH_COMMAND_MODEL_MAP: Final[Dict[SlashCommand, Dict[ModelSet, str]]] = {
 }
 
 
+@lru_cache(maxsize=None)
+def _resolve_model(slash_command: str, model_set: str, default: str) -> str:
+    """Resolve the model for a (slash_command, model_set) pair.
+
+    Pure function of its arguments, so results are memoized for the
+    lifetime of the process.
+    """
+    command_config = SLASH_COMMAND_MODEL_MAP.get(slash_command)
+
+    if command_config:
+        return command_config.get(model_set, command_config.get("base", default))
+
+    return default
+
+
 def get_model_for_slash_command(
     request: AgentTemplateRequest, default: str = "sonnet"
 ) -> str:
@@ -62,23 +152,27 @@ def get_model_for_slash_command(
     if state:
         model_set = state.get("model_set", "base")
 
-    command_config = SLASH_COMMAND_MODEL_MAP.get(request.slash_command)
-
-    if command_config:
-        return command_config.get(model_set, command_config.get("base", default))
-
-    return default
+    return _resolve_model(request.slash_command, model_set, default)
 
 
 def truncate_output(
     output: str, max_length: int = 500, suffix: str = "... (truncated)"
 ) -> str:
     """Truncate output to a reasonable length for display."""
-    if output.startswith('{"type":') and '\n{"type":' in output:
-        lines = output.strip().split("\n")
+    # len < 64 can't hold two JSONL messages, so skip the substring scan.
+    if (
+        len(output) >= 64
+        and output.startswith('{"type":')
+        and '\n{"type":' in output
+    ):
+        # The result/assistant message we want is by CLI convention within
+        # the last few KB, so only split the tail instead of materializing
+        # a list of every line in a possibly MB-scale transcript.
+        tail = output[-65536:]
+        lines = tail.rstrip().rsplit("\n", 50)
         for line in reversed(lines):
             try:
-                data = json.loads(line)
+                data = _json_loads(line)
                 if data.get("type") == "result":
                     result = data.get("result", "")
                     if result:
@@ -91,7 +185,7 @@ def truncate_output(
                             return truncate_output(text, max_length, suffix)
             except:
                 pass
-        return f"[JSONL output with {len(lines)} messages]{suffix}"
+        return f"[JSONL output]{suffix}"
 
     if len(output) <= max_length:
         return output
@@ -109,15 +203,20 @@ def truncate_output(
     return output[:truncate_at] + suffix
 
 
+@lru_cache(maxsize=1)
 def check_claude_installed() -> Optional[str]:
-    """Check if Claude Code CLI is installed."""
+    """Check if Claude Code CLI is installed.
+
+    Cached process-wide: the CLI does not appear or disappear mid-run, so
+    only the first call pays the `claude --version` subprocess spawn.
+    """
     try:
         result = subprocess.run(
-            [CLAUDE_PATH, "--version"], capture_output=True, text=True
+            [CLAUDE_PATH, "--version"], capture_output=True, text=True, timeout=30
         )
         if result.returncode != 0:
             return f"Error: Claude Code CLI is not installed. Expected at: {CLAUDE_PATH}"
-    except FileNotFoundError:
+    except (FileNotFoundError, subprocess.TimeoutExpired):
         return f"Error: Claude Code CLI is not installed. Expected at: {CLAUDE_PATH}"
     return None
 
@@ -128,7 +227,7 @@ def parse_jsonl_output(
     """Parse JSONL output file and return all messages and the result message."""
     try:
         with open(output_file, "r") as f:
-            messages = [json.loads(line) for line in f if line.strip()]
+            messages = [_json_loads(line) for line in f if line.strip()]
 
             result_message = None
             for message in reversed(messages):
@@ -141,63 +240,151 @@ def parse_jsonl_output(
         return [], None
 
 
+def parse_result_message(output_file: str) -> Optional[Dict[str, Any]]:
+    """Scan a JSONL output file and return only the result message.
+
+    Streams the file line by line, keeping just the most recent result
+    message instead of materializing every message in memory. Claude Code
+    transcripts can run to tens of megabytes; the hot path only needs the
+    final result line.
+    """
+    result_message = None
+    try:
+        with open(output_file, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    message = _json_loads(line)
+                except ValueError:
+                    continue
+                if message.get("type") == "result":
+                    result_message = message
+    except Exception:
+        return None
+    return result_message
+
+
 def convert_jsonl_to_json(jsonl_file: str) -> str:
-    """Convert JSONL file to JSON array file."""
+    """Convert JSONL file to JSON array file.
+
+    Each JSONL line is already a valid JSON document, so the raw lines
+    are copied into an array without the parse/re-serialize round trip.
+    Set ADW_VERIFY_JSON=1 to re-validate the produced file.
+    """
     json_file = jsonl_file.replace(".jsonl", ".json")
-    messages, _ = parse_jsonl_output(jsonl_file)
 
-    with open(json_file, "w") as f:
-        json.dump(messages, f, indent=2)
+    with open(jsonl_file, "r") as src, open(json_file, "w") as dst:
+        dst.write("[\n")
+        first = True
+        for line in src:
+            line = line.strip()
+            if not line:
+                continue
+            if not first:
+                dst.write(",\n")
+            dst.write(line)
+            first = False
+        dst.write("\n]")
+
+    if os.getenv("ADW_VERIFY_JSON") == "1":
+        with open(json_file, "r") as f:
+            json.load(f)
 
     return json_file
 
 
+def _response_from_result_message(
+    result_message: Optional[Dict[str, Any]],
+) -> AgentPromptResponse:
+    """Build an AgentPromptResponse from a parsed result message."""
+    if not result_message:
+        error_msg = "No result message found in Claude Code output"
+        return AgentPromptResponse(
+            output=truncate_output(error_msg, max_length=800),
+            success=False,
+            session_id=None,
+            retry_code=RetryCode.NONE,
+        )
+
+    session_id = result_message.get("session_id")
+    is_error = result_message.get("is_error", False)
+    subtype = result_message.get("subtype", "")
+
+    if subtype == "error_during_execution":
+        return AgentPromptResponse(
+            output="Error during execution: Agent encountered an error",
+            success=False,
+            session_id=session_id,
+            retry_code=RetryCode.ERROR_DURING_EXECUTION,
+        )
+
+    result_text = result_message.get("result", "")
+
+    if is_error and len(result_text) > 1000:
+        result_text = truncate_output(result_text, max_length=800)
+
+    return AgentPromptResponse(
+        output=result_text,
+        success=not is_error,
+        session_id=session_id,
+        retry_code=RetryCode.NONE,
+    )
+
+
 def get_claude_env() -> Dict[str, str]:
     """Get environment variables for Claude Code execution."""
     from .utils import get_safe_subprocess_env
-    return get_safe_subprocess_env()
+
+    env = get_safe_subprocess_env()
+    # We already verify the CLI once per process; skip the CLI/SDK's own
+    # per-invocation version probes.
+    env["CLAUDE_AGENT_SDK_SKIP_VERSION_CHECK"] = "1"
+    env["CLAUDE_CODE_SKIP_VERSION_CHECK"] = "1"
+    return env
 
 
 def save_prompt(prompt: str, adw_id: str, agent_name: str = "ops") -> None:
     """Save a prompt to the appropriate logging directory."""
-    match = re.match(r"^(/\w+)", prompt)
+    if not prompt.startswith("/"):
+        return
+
+    match = _SLASH_CMD_RE.match(prompt)
     if not match:
         return
 
     slash_command = match.group(1)
     command_name = slash_command[1:]
 
-    project_root = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
-    prompt_dir = os.path.join(project_root, "agents", adw_id, agent_name, "prompts")
-    os.makedirs(prompt_dir, exist_ok=True)
+    prompt_dir = os.path.join(_AGENTS_DIR, adw_id, agent_name, "prompts")
+    _ensure_dir(prompt_dir)
 
+    # Write via a temp file + rename so a concurrent reader never sees a
+    # partially written prompt.
     prompt_file = os.path.join(prompt_dir, f"{command_name}.txt")
-    with open(prompt_file, "w") as f:
+    tmp_file = f"{prompt_file}.tmp"
+    with open(tmp_file, "w") as f:
         f.write(prompt)
+    os.replace(tmp_file, prompt_file)
 
 
-def prompt_claude_code_with_retry(
+async def prompt_claude_code_with_retry_async(
     request: AgentPromptRequest,
     max_retries: int = 3,
-    retry_delays: List[int] = None,
+    retry_delays: Tuple[float, ...] = None,
 ) -> AgentPromptResponse:
     """Execute Claude Code with retry logic."""
     if retry_delays is None:
-        retry_delays = [1, 3, 5]
-
-    while len(retry_delays) < max_retries:
-        retry_delays.append(retry_delays[-1] + 2)
+        retry_delays = DEFAULT_RETRY_DELAYS
 
     last_response = None
 
     for attempt in range(max_retries + 1):
         if attempt > 0:
-            delay = retry_delays[attempt - 1]
-            time.sleep(delay)
+            delay = retry_delays[min(attempt - 1, len(retry_delays) - 1)]
+            await asyncio.sleep(delay)
 
-        response = prompt_claude_code(request)
+        response = await prompt_claude_code_async(request)
         last_response = response
 
         if response.success or response.retry_code == RetryCode.NONE:
@@ -217,8 +404,24 @@ def prompt_claude_code_with_retry(
     return last_response
 
 
-def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
-    """Execute Claude Code with the given prompt configuration."""
+def prompt_claude_code_with_retry(
+    request: AgentPromptRequest,
+    max_retries: int = 3,
+    retry_delays: Tuple[float, ...] = None,
+) -> AgentPromptResponse:
+    """Synchronous wrapper around prompt_claude_code_with_retry_async."""
+    return asyncio.run(
+        prompt_claude_code_with_retry_async(request, max_retries, retry_delays)
+    )
+
+
+async def prompt_claude_code_async(request: AgentPromptRequest) -> AgentPromptResponse:
+    """Execute Claude Code with the given prompt configuration.
+
+    The subprocess spawn is guarded by the per-loop agent semaphore so callers can gather
+    many executions without oversubscribing the machine; each call only
+    blocks on I/O (the CLI talking to the API), never on a worker thread.
+    """
 
     error_msg = check_claude_installed()
     if error_msg:
@@ -229,11 +432,32 @@ def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
             retry_code=RetryCode.NONE,
         )
 
-    save_prompt(request.prompt, request.adw_id, request.agent_name)
+    # Prompt logging is pure bookkeeping - don't hold up the CLI spawn.
+    _LOG_EXECUTOR.submit(
+        save_prompt, request.prompt, request.adw_id, request.agent_name
+    )
 
     output_dir = os.path.dirname(request.output_file)
     if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
+        _ensure_dir(output_dir)
+
+    from .claude_pool import pool_enabled, get_session_pool
+
+    if pool_enabled():
+        try:
+            lines, result_message = await get_session_pool().run_prompt(
+                request.prompt,
+                working_dir=request.working_dir,
+                model=request.model,
+                dangerously_skip_permissions=request.dangerously_skip_permissions,
+            )
+            with open(request.output_file, "w") as output_f:
+                output_f.writelines(lines)
+            convert_jsonl_to_json(request.output_file)
+            return _response_from_result_message(result_message)
+        except Exception:
+            # Pool workers are best-effort; fall back to spawn-per-call.
+            pass
 
     cmd = [CLAUDE_PATH, "-p", request.prompt]
     cmd.extend(["--model", request.model])
@@ -251,56 +475,60 @@ def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
     env = get_claude_env()
 
     try:
-        with open(request.output_file, "w") as output_f:
-            result = subprocess.run(
-                cmd,
-                stdout=output_f,
-                stderr=subprocess.PIPE,
-                text=True,
+        async with _get_agent_semaphore():
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 env=env,
                 cwd=request.working_dir,
+                limit=STREAM_LIMIT_BYTES,
             )
 
-        if result.returncode == 0:
-            messages, result_message = parse_jsonl_output(request.output_file)
-            json_file = convert_jsonl_to_json(request.output_file)
-
-            if result_message:
-                session_id = result_message.get("session_id")
-                is_error = result_message.get("is_error", False)
-                subtype = result_message.get("subtype", "")
-
-                if subtype == "error_during_execution":
-                    error_msg = "Error during execution: Agent encountered an error"
-                    return AgentPromptResponse(
-                        output=error_msg,
-                        success=False,
-                        session_id=session_id,
-                        retry_code=RetryCode.ERROR_DURING_EXECUTION,
-                    )
-
-                result_text = result_message.get("result", "")
-
-                if is_error and len(result_text) > 1000:
-                    result_text = truncate_output(result_text, max_length=800)
-
-                return AgentPromptResponse(
-                    output=result_text,
-                    success=not is_error,
-                    session_id=session_id,
-                    retry_code=RetryCode.NONE,
-                )
-            else:
-                error_msg = "No result message found in Claude Code output"
-                return AgentPromptResponse(
-                    output=truncate_output(error_msg, max_length=800),
-                    success=False,
-                    session_id=None,
-                    retry_code=RetryCode.NONE,
+            async def _consume_stdout():
+                """Tee stream-json lines to the output file as they arrive,
+                keeping the result message in memory so the file never needs
+                to be re-read after the subprocess exits."""
+                result_message = None
+                with open(request.output_file, "w") as output_f:
+                    while True:
+                        line = await proc.stdout.readline()
+                        if not line:
+                            break
+                        output_f.write(line.decode())
+                        if line.startswith(b'{"type":"result"'):
+                            try:
+                                result_message = _json_loads(line)
+                            except ValueError:
+                                pass
+                return result_message
+
+            try:
+                result_message, stderr_data, _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        _consume_stdout(), proc.stderr.read(), proc.wait()
+                    ),
+                    timeout=CLAUDE_TIMEOUT_S,
                 )
+            except BaseException:
+                # Timeout or any stream/decode failure: reap the still-
+                # running process so it can't linger as an orphan while
+                # the retry loop spawns replacements.
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+                raise
+
+        if proc.returncode == 0:
+            if result_message is None:
+                # Streaming missed the result frame (e.g. unusual key
+                # ordering) - fall back to scanning the written file.
+                result_message = parse_result_message(request.output_file)
+            convert_jsonl_to_json(request.output_file)
+            return _response_from_result_message(result_message)
         else:
-            stderr_msg = result.stderr.strip() if result.stderr else ""
-            error_msg = f"Claude Code error: {stderr_msg}" if stderr_msg else f"Command failed with exit code {result.returncode}"
+            stderr_msg = stderr_data.decode().strip() if stderr_data else ""
+            error_msg = f"Claude Code error: {stderr_msg}" if stderr_msg else f"Command failed with exit code {proc.returncode}"
 
             return AgentPromptResponse(
                 output=truncate_output(error_msg, max_length=800),
@@ -309,7 +537,7 @@ def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
                 retry_code=RetryCode.CLAUDE_CODE_ERROR,
             )
 
-    except subprocess.TimeoutExpired:
+    except (subprocess.TimeoutExpired, asyncio.TimeoutError):
         return AgentPromptResponse(
             output="Error: Claude Code command timed out",
             success=False,
@@ -325,20 +553,65 @@ def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
         )
 
 
-def execute_template(request: AgentTemplateRequest) -> AgentPromptResponse:
-    """Execute a Claude Code template with slash command and arguments."""
+def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
+    """Synchronous wrapper around prompt_claude_code_async."""
+    return asyncio.run(prompt_claude_code_async(request))
+
+
+def _get_inflight() -> Dict[Tuple[str, Tuple[str, ...], str], "asyncio.Future"]:
+    """In-flight template futures for the running loop, keyed by
+    (slash_command, args, adw_id).
+
+    Stored on the loop object rather than a module global because futures
+    are loop-bound: the sync wrappers each asyncio.run a fresh loop
+    (sometimes from ThreadPoolExecutor threads), and awaiting a future
+    attached to another loop raises. The map dies with its loop.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return loop._adw_inflight
+    except AttributeError:
+        inflight: Dict[Tuple[str, Tuple[str, ...], str], "asyncio.Future"] = {}
+        loop._adw_inflight = inflight
+        return inflight
+
+
+async def execute_template_async(request: AgentTemplateRequest) -> AgentPromptResponse:
+    """Execute a Claude Code template with slash command and arguments.
+
+    Safe to asyncio.gather: concurrent executions are throttled by
+    the per-loop agent semaphore in prompt_claude_code_async, and identical concurrent
+    requests (same command, args and adw_id - idempotent reads like
+    /classify_issue) are deduplicated onto one invocation.
+    """
+    inflight = _get_inflight()
+    key = (request.slash_command, tuple(request.args), request.adw_id)
+    existing = inflight.get(key)
+    if existing is not None:
+        return await existing
+
+    future = asyncio.get_running_loop().create_future()
+    inflight[key] = future
+    try:
+        response = await _execute_template(request)
+        future.set_result(response)
+        return response
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        inflight.pop(key, None)
+
+
+async def _execute_template(request: AgentTemplateRequest) -> AgentPromptResponse:
+    """Run a template execution without in-flight deduplication."""
     mapped_model = get_model_for_slash_command(request)
     request = request.model_copy(update={"model": mapped_model})
 
     prompt = f"{request.slash_command} {' '.join(request.args)}"
 
-    project_root = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
-    output_dir = os.path.join(
-        project_root, "agents", request.adw_id, request.agent_name
-    )
-    os.makedirs(output_dir, exist_ok=True)
+    output_dir = os.path.join(_AGENTS_DIR, request.adw_id, request.agent_name)
+    _ensure_dir(output_dir)
 
     output_file = os.path.join(output_dir, "raw_output.jsonl")
 
@@ -352,4 +625,9 @@ def execute_template(request: AgentTemplateRequest) -> AgentPromptResponse:
         working_dir=request.working_dir,
     )
 
-    return prompt_claude_code_with_retry(prompt_request)
+    return await prompt_claude_code_with_retry_async(prompt_request)
+
+
+def execute_template(request: AgentTemplateRequest) -> AgentPromptResponse:
+    """Synchronous wrapper around execute_template_async."""
+    return asyncio.run(execute_template_async(request))
@@ -0,0 +1,240 @@
+"""Persistent Claude Code session pool for ADW workflows (opt-in).
+
+Every `claude -p` invocation pays the full CLI startup cost before any
+work happens. Workflows that issue many slash commands serially per issue
+pay it every time. This pool keeps pre-started
+`claude --input-format stream-json` subprocesses warm and dispatches each
+prompt to one over stdin, so callers grab an already-started worker
+instead of waiting out the CLI boot.
+
+Workers live on a dedicated background event loop thread: the repo's sync
+wrappers asyncio.run a fresh loop per call, and pipe transports are bound
+to the loop that spawned them, so loop-local workers would die with the
+first wrapper's loop. run_prompt can be awaited from any loop; it
+marshals onto the pool loop internally.
+
+Workers are keyed by (working_dir, model, dangerously_skip_permissions):
+a prompt only ever runs on a worker spawned with the same cwd, model and
+permissions flags it asked for. Each worker serves exactly one prompt and
+is then replaced - a fresh session per prompt, same as spawn-per-call -
+with the replacement starting in the background so the next caller still
+skips the startup wait.
+
+Opt-in via ADW_USE_POOL=1; agent.py falls back to spawn-per-call on any
+pool error, so enabling it can never make a workflow fail outright.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+# Number of warm workers kept alive per configuration key.
+POOL_SIZE = int(os.getenv("ADW_POOL_SIZE", "2"))
+
+# (working_dir, model, dangerously_skip_permissions)
+WorkerKey = Tuple[Optional[str], Optional[str], bool]
+
+
+class ClaudeSessionPool:
+    """Pool of pre-started Claude Code subprocesses dispatched via stdin."""
+
+    def __init__(self, size: int = POOL_SIZE):
+        self.size = size
+        self._idle: Dict[WorkerKey, "asyncio.Queue[asyncio.subprocess.Process]"] = {}
+        self._counts: Dict[WorkerKey, int] = {}
+        self._workers: List[asyncio.subprocess.Process] = []
+        self._lock = asyncio.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the pool's background event loop thread on first use."""
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    daemon=True,
+                    name="adw-claude-pool",
+                )
+                self._thread.start()
+            return self._loop
+
+    async def _spawn_worker(self, key: WorkerKey) -> asyncio.subprocess.Process:
+        """Launch one Claude Code worker for this configuration."""
+        from .agent import CLAUDE_PATH, STREAM_LIMIT_BYTES, get_claude_env
+
+        working_dir, model, skip_permissions = key
+        cmd = [
+            CLAUDE_PATH,
+            "-p",
+            "--input-format",
+            "stream-json",
+            "--output-format",
+            "stream-json",
+            "--verbose",
+            "--session-id",
+            str(uuid.uuid4()),
+        ]
+        if model:
+            cmd.extend(["--model", model])
+        if skip_permissions:
+            cmd.append("--dangerously-skip-permissions")
+        return await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=get_claude_env(),
+            cwd=working_dir,
+            limit=STREAM_LIMIT_BYTES,
+        )
+
+    async def _acquire(self, key: WorkerKey) -> asyncio.subprocess.Process:
+        """Get an idle worker for this key, spawning one if under the cap."""
+        async with self._lock:
+            queue = self._idle.setdefault(key, asyncio.Queue())
+            if queue.empty() and self._counts.get(key, 0) < self.size:
+                worker = await self._spawn_worker(key)
+                self._workers.append(worker)
+                self._counts[key] = self._counts.get(key, 0) + 1
+                return worker
+        # Cap reached for this key - wait for a worker to come back.
+        return await queue.get()
+
+    async def _recycle(self, key: WorkerKey, worker: asyncio.subprocess.Process) -> None:
+        """Replace a used worker with a fresh one for the same key.
+
+        Each prompt gets its own session, so the used worker is retired
+        and a replacement is started while the caller moves on; the next
+        prompt for this key finds it already warm in the queue.
+        """
+        if worker.returncode is None:
+            worker.terminate()
+            await worker.wait()
+        try:
+            self._workers.remove(worker)
+        except ValueError:
+            pass
+
+        try:
+            replacement = await self._spawn_worker(key)
+        except Exception:
+            # Couldn't replace it; release the slot so a later _acquire
+            # can try spawning again.
+            async with self._lock:
+                self._counts[key] = max(0, self._counts.get(key, 1) - 1)
+            return
+        self._workers.append(replacement)
+        self._idle.setdefault(key, asyncio.Queue()).put_nowait(replacement)
+
+    async def _run_prompt_on_pool_loop(
+        self, prompt: str, key: WorkerKey
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """Dispatch one prompt to a worker; runs on the pool loop only."""
+        from .agent import CLAUDE_TIMEOUT_S
+
+        worker = await self._acquire(key)
+        try:
+            frame = {
+                "type": "user",
+                "message": {
+                    "role": "user",
+                    "content": [{"type": "text", "text": prompt}],
+                },
+            }
+
+            async def exchange() -> Tuple[List[str], Dict[str, Any]]:
+                worker.stdin.write((json.dumps(frame) + "\n").encode())
+                await worker.stdin.drain()
+
+                lines: List[str] = []
+                while True:
+                    raw = await worker.stdout.readline()
+                    if not raw:
+                        raise RuntimeError("Claude pool worker closed stdout")
+                    line = raw.decode()
+                    lines.append(line)
+                    try:
+                        message = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if message.get("type") == "result":
+                        return lines, message
+
+            # Same ceiling as spawn-per-call; a hung worker is killed by
+            # the recycle below instead of stalling the workflow forever.
+            try:
+                return await asyncio.wait_for(exchange(), timeout=CLAUDE_TIMEOUT_S)
+            except asyncio.TimeoutError:
+                raise RuntimeError(
+                    f"Claude pool worker timed out after {CLAUDE_TIMEOUT_S}s"
+                )
+        finally:
+            asyncio.ensure_future(self._recycle(key, worker))
+
+    async def run_prompt(
+        self,
+        prompt: str,
+        working_dir: Optional[str] = None,
+        model: Optional[str] = None,
+        dangerously_skip_permissions: bool = False,
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """Send a prompt to a fresh matching worker and collect its response.
+
+        Awaitable from any event loop; the work itself runs on the pool's
+        background loop. Returns (raw_jsonl_lines, result_message). Raises
+        RuntimeError if the worker dies, hangs past the timeout, or never
+        produces a result frame; callers should fall back to
+        spawn-per-call.
+        """
+        key: WorkerKey = (working_dir, model, dangerously_skip_permissions)
+        pool_loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(
+            self._run_prompt_on_pool_loop(prompt, key), pool_loop
+        )
+        return await asyncio.wrap_future(future)
+
+    async def _close_on_pool_loop(self) -> None:
+        for worker in self._workers:
+            if worker.returncode is None:
+                worker.terminate()
+        for worker in self._workers:
+            if worker.returncode is None:
+                await worker.wait()
+        self._workers.clear()
+        self._idle.clear()
+        self._counts.clear()
+
+    def close(self) -> None:
+        """Terminate all worker processes and stop the background loop."""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._close_on_pool_loop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join()
+        loop.close()
+
+
+_pool: Optional[ClaudeSessionPool] = None
+
+
+def get_session_pool() -> ClaudeSessionPool:
+    """Get the shared process-wide session pool."""
+    global _pool
+    if _pool is None:
+        _pool = ClaudeSessionPool()
+    return _pool
+
+
+def pool_enabled() -> bool:
+    """Whether prompts should be routed through the session pool."""
+    return os.getenv("ADW_USE_POOL") == "1"
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional, List, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -112,8 +112,7 @@ class GitHubIssueListItem(BaseModel):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
 
 
 class GitHubIssue(BaseModel):
@@ -133,13 +132,14 @@ class GitHubIssue(BaseModel):
     closed_at: Optional[datetime] = Field(None, alias="closedAt")
     url: str
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
 
 
 class AgentPromptRequest(BaseModel):
     """Claude Code agent prompt configuration."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     prompt: str
     adw_id: str
     agent_name: str = "ops"
@@ -152,6 +152,8 @@ class AgentPromptRequest(BaseModel):
 class AgentPromptResponse(BaseModel):
     """Claude Code agent response."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     output: str
     success: bool
     session_id: Optional[str] = None
@@ -186,6 +188,8 @@ class ClaudeCodeResultMessage(BaseModel):
 class TestResult(BaseModel):
     """Individual test result from test suite execution."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     test_name: str
     passed: bool
     execution_command: str
@@ -196,6 +200,8 @@ class TestResult(BaseModel):
 class E2ETestResult(BaseModel):
     """Individual E2E test result from browser automation."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     test_name: str
     status: Literal["passed", "failed"]
     test_path: str
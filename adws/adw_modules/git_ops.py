@@ -1,48 +1,93 @@
-"""Git operations for ADW composable architecture."""
+"""Git operations for ADW composable architecture.
 
+Operations are implemented as coroutines on asyncio subprocesses so
+independent probes can run concurrently; each keeps a synchronous wrapper
+for callers that have not been converted yet.
+"""
+
+import asyncio
+import os
 import subprocess
 import json
 import logging
-from typing import Optional, Tuple
-
-from adw_modules.github import get_repo_url, extract_repo_path, make_issue_comment
-
-
-def get_current_branch(cwd: Optional[str] = None) -> str:
-    """Get current git branch name."""
-    result = subprocess.run(
-        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-        capture_output=True,
-        text=True,
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from adw_modules.github import (
+    GH_TIMEOUT_S,
+    get_repo_url,
+    extract_repo_path,
+    make_issue_comment,
+)
+
+# Local git commands are expected to finish well within this; anything
+# slower is treated as hung, killed and reaped.
+GIT_TIMEOUT_S = 60
+
+
+async def _run(
+    cmd: list,
+    cwd: Optional[str] = None,
+    timeout: float = GIT_TIMEOUT_S,
+    env: Optional[Dict[str, str]] = None,
+) -> Tuple[int, str, str]:
+    """Run a command via asyncio and return (returncode, stdout, stderr).
+
+    On timeout the process is killed and reaped, and a nonzero returncode
+    with a descriptive stderr is returned.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
         cwd=cwd,
+        env=env,
     )
-    return result.stdout.strip()
-
-
-def push_branch(
-    branch_name: str, cwd: Optional[str] = None
-) -> Tuple[bool, Optional[str]]:
-    """Push current branch to remote. Returns (success, error_message)."""
-    result = subprocess.run(
-        ["git", "push", "-u", "origin", branch_name],
-        capture_output=True,
-        text=True,
-        cwd=cwd,
-    )
-    if result.returncode != 0:
-        return False, result.stderr
-    return True, None
-
-
-def check_pr_exists(branch_name: str) -> Optional[str]:
-    """Check if PR exists for branch. Returns PR URL if exists."""
     try:
-        repo_url = get_repo_url()
-        repo_path = extract_repo_path(repo_url)
-    except Exception as e:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return -1, "", f"Command timed out after {timeout}s: {' '.join(cmd)}"
+    return proc.returncode, stdout.decode(), stderr.decode()
+
+
+@lru_cache(maxsize=1)
+def _get_gh_env() -> Dict[str, str]:
+    """Environment for gh subprocesses, built once per process.
+
+    Injecting GH_TOKEN lets gh skip re-reading its hosts.yml auth config
+    on every call; GH_NO_UPDATE_NOTIFIER suppresses the periodic update
+    check gh would otherwise perform on cold invocations.
+    """
+    env = os.environ.copy()
+    github_pat = env.get("GITHUB_PAT")
+    if github_pat and not env.get("GH_TOKEN"):
+        env["GH_TOKEN"] = github_pat
+    env.setdefault("GH_NO_UPDATE_NOTIFIER", "1")
+    env.setdefault("NO_COLOR", "1")
+    return env
+
+
+@lru_cache(maxsize=1)
+def _get_repo_info() -> Tuple[str, str]:
+    """Get (repo_url, repo_path), cached for the process lifetime."""
+    repo_url = get_repo_url()
+    return repo_url, extract_repo_path(repo_url)
+
+
+async def get_pr_info_async(branch_name: str) -> Optional[Dict[str, Any]]:
+    """Get PR info for a branch in a single gh call.
+
+    Returns a dict with url, number, mergeable and mergeStateStatus, or
+    None if no PR exists for the branch.
+    """
+    try:
+        _, repo_path = _get_repo_info()
+    except Exception:
         return None
 
-    result = subprocess.run(
+    returncode, stdout, _ = await _run(
         [
             "gh",
             "pr",
@@ -52,119 +97,151 @@ def check_pr_exists(branch_name: str) -> Optional[str]:
             "--head",
             branch_name,
             "--json",
-            "url",
+            "url,number,mergeable,mergeStateStatus",
+            "--limit",
+            "1",
         ],
-        capture_output=True,
-        text=True,
+        timeout=GH_TIMEOUT_S,
+        env=_get_gh_env(),
     )
-    if result.returncode == 0:
-        prs = json.loads(result.stdout)
+    if returncode == 0:
+        prs = json.loads(stdout)
         if prs:
-            return prs[0]["url"]
+            return prs[0]
     return None
 
 
-def create_branch(
+def get_pr_info(branch_name: str) -> Optional[Dict[str, Any]]:
+    """Synchronous wrapper around get_pr_info_async."""
+    return asyncio.run(get_pr_info_async(branch_name))
+
+
+async def get_current_branch_async(cwd: Optional[str] = None) -> str:
+    """Get current git branch name."""
+    _, stdout, _ = await _run(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=cwd)
+    return stdout.strip()
+
+
+def get_current_branch(cwd: Optional[str] = None) -> str:
+    """Synchronous wrapper around get_current_branch_async."""
+    return asyncio.run(get_current_branch_async(cwd))
+
+
+async def push_branch_async(
+    branch_name: str, cwd: Optional[str] = None
+) -> Tuple[bool, Optional[str]]:
+    """Push current branch to remote. Returns (success, error_message)."""
+    returncode, _, stderr = await _run(
+        ["git", "push", "-u", "origin", branch_name], cwd=cwd
+    )
+    if returncode != 0:
+        return False, stderr
+    return True, None
+
+
+def push_branch(
+    branch_name: str, cwd: Optional[str] = None
+) -> Tuple[bool, Optional[str]]:
+    """Synchronous wrapper around push_branch_async."""
+    return asyncio.run(push_branch_async(branch_name, cwd))
+
+
+def check_pr_exists(branch_name: str) -> Optional[str]:
+    """Check if PR exists for branch. Returns PR URL if exists."""
+    pr_info = get_pr_info(branch_name)
+    return pr_info["url"] if pr_info else None
+
+
+async def create_branch_async(
     branch_name: str, cwd: Optional[str] = None
 ) -> Tuple[bool, Optional[str]]:
     """Create and checkout a new branch. Returns (success, error_message)."""
-    result = subprocess.run(
-        ["git", "checkout", "-b", branch_name], capture_output=True, text=True, cwd=cwd
+    returncode, _, stderr = await _run(
+        ["git", "checkout", "-b", branch_name], cwd=cwd
     )
-    if result.returncode != 0:
-        if "already exists" in result.stderr:
-            result = subprocess.run(
-                ["git", "checkout", branch_name],
-                capture_output=True,
-                text=True,
-                cwd=cwd,
+    if returncode != 0:
+        if "already exists" in stderr:
+            returncode, _, stderr = await _run(
+                ["git", "checkout", branch_name], cwd=cwd
             )
-            if result.returncode != 0:
-                return False, result.stderr
+            if returncode != 0:
+                return False, stderr
             return True, None
-        return False, result.stderr
+        return False, stderr
     return True, None
 
 
-def commit_changes(
+def create_branch(
+    branch_name: str, cwd: Optional[str] = None
+) -> Tuple[bool, Optional[str]]:
+    """Synchronous wrapper around create_branch_async."""
+    return asyncio.run(create_branch_async(branch_name, cwd))
+
+
+async def commit_changes_async(
     message: str, cwd: Optional[str] = None
 ) -> Tuple[bool, Optional[str]]:
     """Stage all changes and commit. Returns (success, error_message)."""
-    result = subprocess.run(
-        ["git", "status", "--porcelain"], capture_output=True, text=True, cwd=cwd
+    # git diff --quiet signals tracked changes via exit code alone - no
+    # stdout to capture or parse. It can't see untracked files, so those
+    # are probed concurrently to keep new-file-only commits working.
+    (diff_rc, _, _), (_, untracked, _) = await asyncio.gather(
+        _run(["git", "diff", "--quiet", "HEAD"], cwd=cwd),
+        _run(["git", "ls-files", "--others", "--exclude-standard"], cwd=cwd),
     )
-    if not result.stdout.strip():
+    if diff_rc == 0 and not untracked.strip():
         return True, None
 
-    result = subprocess.run(
-        ["git", "add", "-A"], capture_output=True, text=True, cwd=cwd
-    )
-    if result.returncode != 0:
-        return False, result.stderr
+    returncode, _, stderr = await _run(["git", "add", "-A"], cwd=cwd)
+    if returncode != 0:
+        return False, stderr
 
-    result = subprocess.run(
-        ["git", "commit", "-m", message], capture_output=True, text=True, cwd=cwd
-    )
-    if result.returncode != 0:
-        return False, result.stderr
+    returncode, _, stderr = await _run(["git", "commit", "-m", message], cwd=cwd)
+    if returncode != 0:
+        return False, stderr
     return True, None
 
 
+def commit_changes(
+    message: str, cwd: Optional[str] = None
+) -> Tuple[bool, Optional[str]]:
+    """Synchronous wrapper around commit_changes_async."""
+    return asyncio.run(commit_changes_async(message, cwd))
+
+
 def get_pr_number(branch_name: str) -> Optional[str]:
     """Get PR number for a branch. Returns PR number if exists."""
-    try:
-        repo_url = get_repo_url()
-        repo_path = extract_repo_path(repo_url)
-    except Exception as e:
-        return None
-
-    result = subprocess.run(
-        [
-            "gh",
-            "pr",
-            "list",
-            "--repo",
-            repo_path,
-            "--head",
-            branch_name,
-            "--json",
-            "number",
-            "--limit",
-            "1",
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode == 0:
-        prs = json.loads(result.stdout)
-        if prs:
-            return str(prs[0]["number"])
-    return None
+    pr_info = get_pr_info(branch_name)
+    return str(pr_info["number"]) if pr_info else None
 
 
 def approve_pr(pr_number: str, logger: logging.Logger) -> Tuple[bool, Optional[str]]:
     """Approve a PR. Returns (success, error_message)."""
     try:
-        repo_url = get_repo_url()
-        repo_path = extract_repo_path(repo_url)
+        _, repo_path = _get_repo_info()
     except Exception as e:
         return False, f"Failed to get repo info: {e}"
 
-    result = subprocess.run(
-        [
-            "gh",
-            "pr",
-            "review",
-            pr_number,
-            "--repo",
-            repo_path,
-            "--approve",
-            "--body",
-            "ADW Ship workflow approved this PR after validating all state fields.",
-        ],
-        capture_output=True,
-        text=True,
-    )
+    try:
+        result = subprocess.run(
+            [
+                "gh",
+                "pr",
+                "review",
+                pr_number,
+                "--repo",
+                repo_path,
+                "--approve",
+                "--body",
+                "ADW Ship workflow approved this PR after validating all state fields.",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=GH_TIMEOUT_S,
+            env=_get_gh_env(),
+        )
+    except subprocess.TimeoutExpired:
+        return False, f"gh pr review timed out after {GH_TIMEOUT_S}s"
     if result.returncode != 0:
         return False, result.stderr
 
@@ -173,37 +250,28 @@ def approve_pr(pr_number: str, logger: logging.Logger) -> Tuple[bool, Optional[s
 
 
 def merge_pr(
-    pr_number: str, logger: logging.Logger, merge_method: str = "squash"
+    pr_number: str,
+    logger: logging.Logger,
+    merge_method: str = "squash",
+    pr_info: Optional[Dict[str, Any]] = None,
 ) -> Tuple[bool, Optional[str]]:
-    """Merge a PR. Returns (success, error_message)."""
+    """Merge a PR. Returns (success, error_message).
+
+    Merges in a single gh call: gh itself refuses non-mergeable PRs, so
+    there is no separate status probe. A dict from get_pr_info can still
+    be passed to fail fast without spawning gh at all. Set
+    ADW_AUTO_MERGE=1 to queue the merge for when the PR becomes
+    mergeable instead of failing.
+    """
     try:
-        repo_url = get_repo_url()
-        repo_path = extract_repo_path(repo_url)
+        _, repo_path = _get_repo_info()
     except Exception as e:
         return False, f"Failed to get repo info: {e}"
 
-    result = subprocess.run(
-        [
-            "gh",
-            "pr",
-            "view",
-            pr_number,
-            "--repo",
-            repo_path,
-            "--json",
-            "mergeable,mergeStateStatus",
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return False, f"Failed to check PR status: {result.stderr}"
-
-    pr_status = json.loads(result.stdout)
-    if pr_status.get("mergeable") != "MERGEABLE":
+    if pr_info is not None and pr_info.get("mergeable") != "MERGEABLE":
         return (
             False,
-            f"PR is not mergeable. Status: {pr_status.get('mergeStateStatus', 'unknown')}",
+            f"PR is not mergeable. Status: {pr_info.get('mergeStateStatus', 'unknown')}",
         )
 
     merge_cmd = [
@@ -216,25 +284,43 @@ def merge_pr(
         f"--{merge_method}",
     ]
 
+    if os.getenv("ADW_AUTO_MERGE") == "1":
+        merge_cmd.append("--auto")
+
     merge_cmd.extend(
         ["--body", "Merged by ADW Ship workflow after successful validation."]
     )
 
-    result = subprocess.run(merge_cmd, capture_output=True, text=True)
+    try:
+        result = subprocess.run(
+            merge_cmd,
+            capture_output=True,
+            text=True,
+            timeout=GIT_TIMEOUT_S,
+            env=_get_gh_env(),
+        )
+    except subprocess.TimeoutExpired:
+        return False, f"gh pr merge timed out after {GIT_TIMEOUT_S}s"
     if result.returncode != 0:
+        if "not mergeable" in result.stderr.lower():
+            return False, f"PR is not mergeable: {result.stderr}"
         return False, result.stderr
 
     logger.info(f"Merged PR #{pr_number} using {merge_method} method")
     return True, None
 
 
-def finalize_git_operations(
+async def finalize_git_operations_async(
     state: "ADWState", logger: logging.Logger, cwd: Optional[str] = None
 ) -> None:
-    """Standard git finalization: push branch and create/update PR."""
+    """Standard git finalization: push branch and create/update PR.
+
+    The push and the PR lookup are independent (the lookup only lists
+    already-open PRs), so they run concurrently.
+    """
     branch_name = state.get("branch_name")
     if not branch_name:
-        current_branch = get_current_branch(cwd=cwd)
+        current_branch = await get_current_branch_async(cwd=cwd)
         if current_branch and current_branch != "main":
             logger.warning(
                 f"No branch name in state, using current branch: {current_branch}"
@@ -246,14 +332,17 @@ def finalize_git_operations(
             )
             return
 
-    success, error = push_branch(branch_name, cwd=cwd)
+    (success, error), pr_info = await asyncio.gather(
+        push_branch_async(branch_name, cwd=cwd),
+        get_pr_info_async(branch_name),
+    )
     if not success:
         logger.error(f"Failed to push branch: {error}")
         return
 
     logger.info(f"Pushed branch: {branch_name}")
 
-    pr_url = check_pr_exists(branch_name)
+    pr_url = pr_info["url"] if pr_info else None
     issue_number = state.get("issue_number")
     adw_id = state.get("adw_id")
 
@@ -264,15 +353,20 @@ def finalize_git_operations(
     else:
         if issue_number:
             try:
-                repo_url = get_repo_url()
-                repo_path = extract_repo_path(repo_url)
+                _, repo_path = _get_repo_info()
                 from adw_modules.github import fetch_issue
 
                 issue = fetch_issue(issue_number, repo_path)
 
                 from adw_modules.workflow_ops import create_pull_request
 
-                pr_url, error = create_pull_request(branch_name, issue, state, logger, cwd)
+                # create_pull_request is sync and internally asyncio.runs a
+                # template execution; calling it inline would nest
+                # asyncio.run inside this running loop and raise. A worker
+                # thread gives its wrapper a loop of its own.
+                pr_url, error = await asyncio.to_thread(
+                    create_pull_request, branch_name, issue, state, logger, cwd
+                )
             except Exception as e:
                 logger.error(f"Failed to fetch issue for PR creation: {e}")
                 pr_url, error = None, str(e)
@@ -287,3 +381,10 @@ def finalize_git_operations(
                 )
         else:
             logger.error(f"Failed to create PR: {error}")
+
+
+def finalize_git_operations(
+    state: "ADWState", logger: logging.Logger, cwd: Optional[str] = None
+) -> None:
+    """Synchronous wrapper around finalize_git_operations_async."""
+    asyncio.run(finalize_git_operations_async(state, logger, cwd))
@@ -1,15 +1,26 @@
 """GitHub Operations Module - AI Developer Workflow (ADW)"""
 
+import hashlib
 import subprocess
 import sys
 import os
 import json
+from functools import lru_cache
 from typing import Dict, List, Optional
+from pydantic import TypeAdapter
 from .data_types import GitHubIssue, GitHubIssueListItem, GitHubComment
 
 # Bot identifier to prevent webhook loops and filter bot comments
 ADW_BOT_IDENTIFIER = "[ADW-AGENTS]"
 
+# gh network calls are expected to finish well within this; anything
+# slower is treated as hung, killed and reaped. git_ops reuses it for
+# its own gh invocations (defined here, not there, to avoid a cycle).
+GH_TIMEOUT_S = 30
+
+# Validates gh's JSON array output directly, without a Python-side loop
+_ISSUE_LIST_ADAPTER = TypeAdapter(List[GitHubIssueListItem])
+
 
 def get_github_env() -> Optional[dict]:
     """Get environment with GitHub token set up."""
@@ -24,20 +35,28 @@ def get_github_env() -> Optional[dict]:
     return env
 
 
+@lru_cache(maxsize=1)
 def get_repo_url() -> str:
-    """Get GitHub repository URL from git remote."""
+    """Get GitHub repository URL from git remote.
+
+    The origin remote doesn't change mid-run, and make_issue_comment asks
+    for it on every progress update - cache the subprocess call.
+    """
     try:
         result = subprocess.run(
             ["git", "remote", "get-url", "origin"],
             capture_output=True,
             text=True,
             check=True,
+            timeout=GH_TIMEOUT_S,
         )
         return result.stdout.strip()
     except subprocess.CalledProcessError:
         raise ValueError(
             "No git remote 'origin' found. Please ensure you're in a git repository with a remote."
         )
+    except subprocess.TimeoutExpired:
+        raise ValueError(f"git remote get-url timed out after {GH_TIMEOUT_S}s")
     except FileNotFoundError:
         raise ValueError("git command not found. Please ensure git is installed.")
 
@@ -47,8 +66,15 @@ def extract_repo_path(github_url: str) -> str:
     return github_url.replace("https://github.com/", "").replace(".git", "")
 
 
+@lru_cache(maxsize=32)
 def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
-    """Fetch GitHub issue using gh CLI and return typed model."""
+    """Fetch GitHub issue using gh CLI and return typed model.
+
+    Cached per (issue_number, repo_path): long ADW runs re-read the same
+    issue across phases and each fetch is an authenticated API call that
+    counts against the rate limit. Call fetch_issue.cache_clear() when a
+    fresh read (e.g. new comments) is required.
+    """
     cmd = [
         "gh",
         "issue",
@@ -63,15 +89,22 @@ def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
     env = get_github_env()
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, env=env, timeout=GH_TIMEOUT_S
+        )
 
         if result.returncode == 0:
-            issue_data = json.loads(result.stdout)
-            issue = GitHubIssue(**issue_data)
+            # Rust-level JSON validation; skips the json.loads dict round trip
+            issue = GitHubIssue.model_validate_json(result.stdout)
             return issue
         else:
             print(result.stderr, file=sys.stderr)
             sys.exit(result.returncode)
+    except subprocess.TimeoutExpired:
+        print(
+            f"Error: gh issue view timed out after {GH_TIMEOUT_S}s", file=sys.stderr
+        )
+        sys.exit(1)
     except FileNotFoundError:
         print("Error: GitHub CLI (gh) is not installed.", file=sys.stderr)
         sys.exit(1)
@@ -80,6 +113,11 @@ def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
         sys.exit(1)
 
 
+# Last posted comment digest per issue; repeated identical progress
+# messages are dropped instead of spending an API call each.
+_LAST_COMMENT_DIGEST: Dict[str, str] = {}
+
+
 def make_issue_comment(issue_id: str, comment: str) -> None:
     """Post a comment to a GitHub issue using gh CLI."""
     github_repo_url = get_repo_url()
@@ -88,6 +126,11 @@ def make_issue_comment(issue_id: str, comment: str) -> None:
     if not comment.startswith(ADW_BOT_IDENTIFIER):
         comment = f"{ADW_BOT_IDENTIFIER} {comment}"
 
+    digest = hashlib.sha256(comment.encode()).hexdigest()
+    if _LAST_COMMENT_DIGEST.get(issue_id) == digest:
+        print(f"Skipping duplicate comment to issue #{issue_id}")
+        return
+
     cmd = [
         "gh",
         "issue",
@@ -102,9 +145,12 @@ def make_issue_comment(issue_id: str, comment: str) -> None:
     env = get_github_env()
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, env=env, timeout=GH_TIMEOUT_S
+        )
 
         if result.returncode == 0:
+            _LAST_COMMENT_DIGEST[issue_id] = digest
             print(f"Successfully posted comment to issue #{issue_id}")
         else:
             print(f"Error posting comment: {result.stderr}", file=sys.stderr)
@@ -114,6 +160,34 @@ def make_issue_comment(issue_id: str, comment: str) -> None:
         raise
 
 
+class CommentBatcher:
+    """Buffer progress comments and post them in one API call per phase.
+
+    Long workflows post a dozen or more small status updates; each one is
+    an authenticated POST against the rate limit. Buffered messages are
+    concatenated and flushed at phase boundaries instead. Consecutive
+    identical messages are dropped at add() time.
+    """
+
+    def __init__(self, issue_id: str):
+        self.issue_id = issue_id
+        self._pending: List[str] = []
+
+    def add(self, message: str) -> None:
+        """Queue a message; duplicates of the previous entry are skipped."""
+        if self._pending and self._pending[-1] == message:
+            return
+        self._pending.append(message)
+
+    def flush(self) -> None:
+        """Post all queued messages as a single comment."""
+        if not self._pending:
+            return
+        body = "\n\n---\n\n".join(self._pending)
+        self._pending.clear()
+        make_issue_comment(self.issue_id, body)
+
+
 def mark_issue_in_progress(issue_id: str) -> None:
     """Mark issue as in progress by adding label and comment."""
     github_repo_url = get_repo_url()
@@ -132,9 +206,14 @@ def mark_issue_in_progress(issue_id: str) -> None:
 
     env = get_github_env()
 
-    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
-    if result.returncode != 0:
-        print(f"Note: Could not add 'in_progress' label: {result.stderr}")
+    try:
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, env=env, timeout=GH_TIMEOUT_S
+        )
+        if result.returncode != 0:
+            print(f"Note: Could not add 'in_progress' label: {result.stderr}")
+    except subprocess.TimeoutExpired:
+        print(f"Note: Could not add 'in_progress' label: timed out after {GH_TIMEOUT_S}s")
 
     cmd = [
         "gh",
@@ -146,9 +225,14 @@ def mark_issue_in_progress(issue_id: str) -> None:
         "--add-assignee",
         "@me",
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
-    if result.returncode == 0:
-        print(f"Assigned issue #{issue_id} to self")
+    try:
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, env=env, timeout=GH_TIMEOUT_S
+        )
+        if result.returncode == 0:
+            print(f"Assigned issue #{issue_id} to self")
+    except subprocess.TimeoutExpired:
+        print(f"Note: Could not assign issue #{issue_id}: timed out after {GH_TIMEOUT_S}s")
 
 
 def fetch_open_issues(repo_path: str) -> List[GitHubIssueListItem]:
@@ -171,17 +255,23 @@ def fetch_open_issues(repo_path: str) -> List[GitHubIssueListItem]:
         env = get_github_env()
 
         result = subprocess.run(
-            cmd, capture_output=True, text=True, check=True, env=env
+            cmd, capture_output=True, text=True, check=True, env=env,
+            timeout=GH_TIMEOUT_S,
         )
 
-        issues_data = json.loads(result.stdout)
-        issues = [GitHubIssueListItem(**issue_data) for issue_data in issues_data]
+        issues = _ISSUE_LIST_ADAPTER.validate_json(result.stdout)
         print(f"Fetched {len(issues)} open issues")
         return issues
 
     except subprocess.CalledProcessError as e:
         print(f"ERROR: Failed to fetch issues: {e.stderr}", file=sys.stderr)
         return []
+    except subprocess.TimeoutExpired:
+        print(
+            f"ERROR: Failed to fetch issues: timed out after {GH_TIMEOUT_S}s",
+            file=sys.stderr,
+        )
+        return []
     except json.JSONDecodeError as e:
         print(f"ERROR: Failed to parse issues JSON: {e}", file=sys.stderr)
         return []
@@ -204,7 +294,8 @@ def fetch_issue_comments(repo_path: str, issue_number: int) -> List[Dict]:
         env = get_github_env()
 
         result = subprocess.run(
-            cmd, capture_output=True, text=True, check=True, env=env
+            cmd, capture_output=True, text=True, check=True, env=env,
+            timeout=GH_TIMEOUT_S,
         )
         data = json.loads(result.stdout)
         comments = data.get("comments", [])
@@ -219,6 +310,13 @@ def fetch_issue_comments(repo_path: str, issue_number: int) -> List[Dict]:
             file=sys.stderr,
         )
         return []
+    except subprocess.TimeoutExpired:
+        print(
+            f"ERROR: Failed to fetch comments for issue #{issue_number}: "
+            f"timed out after {GH_TIMEOUT_S}s",
+            file=sys.stderr,
+        )
+        return []
     except json.JSONDecodeError as e:
         print(
             f"ERROR: Failed to parse comments JSON for issue #{issue_number}: {e}",
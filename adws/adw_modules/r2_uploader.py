@@ -2,12 +2,16 @@
 
 import os
 import logging
+import mimetypes
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Dict, List
 from pathlib import Path
 
 # boto3 is optional - only needed if R2 uploads are configured
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
     from botocore.client import Config
     from botocore.exceptions import ClientError
     BOTO3_AVAILABLE = True
@@ -15,6 +19,22 @@ except ImportError:
     BOTO3_AVAILABLE = False
 
 
+# boto3 client construction loads and parses the full S3 service model;
+# the client is thread-safe, so every R2Uploader with the same
+# credentials can share one. Keyed by the env tuple so a credential
+# change mid-process still gets a fresh client.
+@lru_cache(maxsize=None)
+def _get_r2_client(account_id: str, access_key_id: str, secret_access_key: str):
+    return boto3.client(
+        's3',
+        endpoint_url=f'https://{account_id}.r2.cloudflarestorage.com',
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        config=Config(signature_version='s3v4', max_pool_connections=16),
+        region_name='us-east-1'
+    )
+
+
 class R2Uploader:
     """Handle uploads to Cloudflare R2 public bucket."""
 
@@ -23,6 +43,7 @@ class R2Uploader:
         self.client = None
         self.bucket_name = None
         self.public_domain = None
+        self.transfer_config = None
         self.enabled = False
 
         self._initialize()
@@ -33,24 +54,26 @@ class R2Uploader:
             self.logger.info("R2 upload disabled - boto3 not installed")
             return
 
-        account_id = os.getenv("CLOUDFLARE_ACCOUNT_ID")
-        access_key_id = os.getenv("CLOUDFLARE_R2_ACCESS_KEY_ID")
-        secret_access_key = os.getenv("CLOUDFLARE_R2_SECRET_ACCESS_KEY")
-        self.bucket_name = os.getenv("CLOUDFLARE_R2_BUCKET_NAME")
-        self.public_domain = os.getenv("CLOUDFLARE_R2_PUBLIC_DOMAIN")
+        env = os.environ
+        account_id = env.get("CLOUDFLARE_ACCOUNT_ID")
+        access_key_id = env.get("CLOUDFLARE_R2_ACCESS_KEY_ID")
+        secret_access_key = env.get("CLOUDFLARE_R2_SECRET_ACCESS_KEY")
+        self.bucket_name = env.get("CLOUDFLARE_R2_BUCKET_NAME")
+        self.public_domain = env.get("CLOUDFLARE_R2_PUBLIC_DOMAIN")
 
-        if not all([account_id, access_key_id, secret_access_key, self.bucket_name]):
+        if not all((account_id, access_key_id, secret_access_key, self.bucket_name)):
             self.logger.info("R2 upload disabled - missing required environment variables")
             return
 
         try:
-            self.client = boto3.client(
-                's3',
-                endpoint_url=f'https://{account_id}.r2.cloudflarestorage.com',
-                aws_access_key_id=access_key_id,
-                aws_secret_access_key=secret_access_key,
-                config=Config(signature_version='s3v4'),
-                region_name='us-east-1'
+            self.client = _get_r2_client(account_id, access_key_id, secret_access_key)
+            # Parallel multipart parts for anything over 8 MB; small
+            # screenshots still go up as a single PUT.
+            self.transfer_config = TransferConfig(
+                multipart_threshold=8 * 1024 * 1024,
+                multipart_chunksize=8 * 1024 * 1024,
+                max_concurrency=10,
+                use_threads=True,
             )
             self.enabled = True
             self.logger.info(f"R2 upload enabled - bucket: {self.bucket_name}")
@@ -63,39 +86,91 @@ class R2Uploader:
         if not self.enabled:
             return None
 
-        if not os.path.isabs(file_path):
-            file_path = os.path.abspath(file_path)
+        # One stat via is_file() instead of an exists() check plus the
+        # abspath normalization's own filesystem walk.
+        path = Path(file_path)
+        if not path.is_absolute():
+            path = path.resolve()
 
-        if not os.path.exists(file_path):
-            self.logger.warning(f"File not found: {file_path}")
+        if not path.is_file():
+            self.logger.warning(f"File not found: {path}")
             return None
 
         if not object_key:
-            object_key = f"adw/review/{Path(file_path).name}"
+            object_key = f"adw/review/{path.name}"
 
         try:
-            self.client.upload_file(file_path, self.bucket_name, object_key)
-            self.logger.info(f"Uploaded {file_path} to R2 as {object_key}")
+            self.client.upload_file(
+                str(path), self.bucket_name, object_key, Config=self.transfer_config
+            )
+            self.logger.info(f"Uploaded {path} to R2 as {object_key}")
 
             public_url = f"https://{self.public_domain}/{object_key}"
             return public_url
 
         except Exception as e:
-            self.logger.error(f"Failed to upload {file_path} to R2: {e}")
+            self.logger.error(f"Failed to upload {path} to R2: {e}")
             return None
 
-    def upload_screenshots(self, screenshots: List[str], adw_id: str) -> Dict[str, str]:
-        """Upload multiple screenshots and return mapping of local paths to public URLs."""
-        url_mapping = {}
+    def upload_bytes(self, data: bytes, object_key: str) -> Optional[str]:
+        """Upload an in-memory payload to R2 and return the public URL.
 
-        for screenshot_path in screenshots:
-            if not screenshot_path:
-                continue
+        Skips the write-to-disk/read-back roundtrip for content that is
+        already in memory (e.g. screenshot bytes from a headless browser).
+        """
+        if not self.enabled:
+            return None
 
-            filename = Path(screenshot_path).name
-            object_key = f"adw/{adw_id}/review/{filename}"
+        content_type = mimetypes.guess_type(object_key)[0] or "application/octet-stream"
 
-            public_url = self.upload_file(screenshot_path, object_key)
-            url_mapping[screenshot_path] = public_url or screenshot_path
+        try:
+            self.client.put_object(
+                Bucket=self.bucket_name,
+                Key=object_key,
+                Body=data,
+                ContentType=content_type,
+            )
+            self.logger.info(f"Uploaded {len(data)} bytes to R2 as {object_key}")
+
+            public_url = f"https://{self.public_domain}/{object_key}"
+            return public_url
+
+        except Exception as e:
+            self.logger.error(f"Failed to upload bytes to R2 as {object_key}: {e}")
+            return None
 
-        return url_mapping
+    def upload_screenshots(
+        self,
+        screenshots: List[str],
+        adw_id: str,
+        payloads: Optional[Dict[str, bytes]] = None,
+    ) -> Dict[str, str]:
+        """Upload multiple screenshots and return mapping of local paths to public URLs.
+
+        Uploads run concurrently: each PUT is network-bound, so wall time
+        is bounded by the slowest file rather than the sum. The boto3
+        client is thread-safe and shared across workers. Entries with an
+        in-memory payload in `payloads` bypass the disk read entirely.
+        """
+        screenshots = [path for path in screenshots if path]
+        if not screenshots:
+            return {}
+
+        payloads = payloads or {}
+        # Invariant across the batch; built once instead of per screenshot
+        key_prefix = f"adw/{adw_id}/review/"
+
+        def upload_one(screenshot_path: str) -> Optional[str]:
+            object_key = key_prefix + Path(screenshot_path).name
+            data = payloads.get(screenshot_path)
+            if data is not None:
+                return self.upload_bytes(data, object_key)
+            return self.upload_file(screenshot_path, object_key)
+
+        with ThreadPoolExecutor(max_workers=min(len(screenshots), 8)) as executor:
+            urls = executor.map(upload_one, screenshots)
+
+        return {
+            path: url or path
+            for path, url in zip(screenshots, urls)
+        }
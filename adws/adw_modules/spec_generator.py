@@ -2,15 +2,26 @@
 
 import os
 import re
+from contextlib import suppress
 from typing import Tuple, Optional
 from adw_modules.data_types import GitHubIssue
 
+# Compiled once; slugify runs per generated spec.
+_SLUG_NONWORD = re.compile(r'[^\w\s-]')
+_SLUG_WS = re.compile(r'[\s_]+')
+
+_SPEC_TYPE_MAP = {
+    "/feature": "Feature",
+    "/bug": "Bug Fix",
+    "/chore": "Maintenance",
+}
+
 
 def slugify(text: str) -> str:
     """Convert text to a URL-safe slug."""
     slug = text.lower()
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '-', slug)
+    slug = _SLUG_NONWORD.sub('', slug)
+    slug = _SLUG_WS.sub('-', slug)
     slug = slug.strip('-')
     return slug[:50]
 
@@ -28,12 +39,7 @@ def generate_spec_from_issue(
     filename = f"{slug}.md"
     filepath = os.path.join(specs_dir, filename)
 
-    spec_type_map = {
-        "/feature": "Feature",
-        "/bug": "Bug Fix",
-        "/chore": "Maintenance",
-    }
-    spec_type = spec_type_map.get(issue_class, "Task")
+    spec_type = _SPEC_TYPE_MAP.get(issue_class, "Task")
 
     labels = [label.name for label in issue.labels] if issue.labels else []
     labels_str = ", ".join(labels) if labels else "none"
@@ -70,7 +76,8 @@ Based on the issue description above, implement the requested changes.
 """
 
     try:
-        with open(filepath, 'w') as f:
+        # Single buffered write; spec files are built fully in memory
+        with open(filepath, 'w', buffering=131072) as f:
             f.write(spec_content)
 
         return f"specs/{filename}", None
@@ -84,10 +91,10 @@ def clear_specs_directory(specs_dir: str) -> None:
     if not os.path.exists(specs_dir):
         return
 
-    for filename in os.listdir(specs_dir):
-        if filename.endswith('.md'):
-            filepath = os.path.join(specs_dir, filename)
-            try:
-                os.remove(filepath)
-            except Exception:
-                pass
+    # scandir yields DirEntry objects with cached type info and ready-made
+    # paths, avoiding a stat and a path join per file
+    with os.scandir(specs_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.md') and entry.is_file():
+                with suppress(OSError):
+                    os.unlink(entry.path)
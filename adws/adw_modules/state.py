@@ -4,6 +4,7 @@ import json
 import os
 import sys
 import logging
+from contextlib import contextmanager
 from typing import Dict, Any, Optional
 from adw_modules.data_types import ADWStateData
 
@@ -13,6 +14,11 @@ class ADWState:
 
     STATE_FILENAME = "adw_state.json"
 
+    # In-process cache of loaded states keyed by adw_id. Entries hold the
+    # live ADWState object, so in-process mutations stay visible; save()
+    # refreshes the entry after writing to disk.
+    _load_cache: Dict[str, "ADWState"] = {}
+
     def __init__(self, adw_id: str):
         """Initialize ADWState with a required ADW ID."""
         if not adw_id:
@@ -21,6 +27,7 @@ class ADWState:
         self.adw_id = adw_id
         self.data: Dict[str, Any] = {"adw_id": self.adw_id}
         self.logger = logging.getLogger(__name__)
+        self._in_transaction = False
 
     def update(self, **kwargs):
         """Update state with new key-value pairs."""
@@ -57,8 +64,26 @@ class ADWState:
         )
         return os.path.join(project_root, "agents", self.adw_id, self.STATE_FILENAME)
 
+    @contextmanager
+    def transaction(self, workflow_step: Optional[str] = None):
+        """Defer saves until the block exits.
+
+        Workflows make several discrete update()+save() calls in a row;
+        wrapping them in a transaction collapses the JSON rewrites into a
+        single one on exit. Saves issued inside the block become no-ops.
+        """
+        self._in_transaction = True
+        try:
+            yield self
+        finally:
+            self._in_transaction = False
+            self.save(workflow_step)
+
     def save(self, workflow_step: Optional[str] = None) -> None:
         """Save state to file in agents/{adw_id}/adw_state.json."""
+        if self._in_transaction:
+            return
+
         state_path = self.get_state_path()
         os.makedirs(os.path.dirname(state_path), exist_ok=True)
 
@@ -78,6 +103,8 @@ class ADWState:
         with open(state_path, "w") as f:
             json.dump(state_data.model_dump(), f, indent=2)
 
+        ADWState._load_cache[self.adw_id] = self
+
         self.logger.info(f"Saved state to {state_path}")
         if workflow_step:
             self.logger.info(f"State updated by: {workflow_step}")
@@ -86,7 +113,15 @@ class ADWState:
     def load(
         cls, adw_id: str, logger: Optional[logging.Logger] = None
     ) -> Optional["ADWState"]:
-        """Load state from file if it exists."""
+        """Load state from file if it exists.
+
+        Returns the cached in-process state when available to avoid
+        re-reading and re-validating the file on every template execution.
+        """
+        cached = cls._load_cache.get(adw_id)
+        if cached is not None:
+            return cached
+
         project_root = os.path.dirname(
             os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         )
@@ -107,6 +142,7 @@ class ADWState:
                 logger.info(f"Found existing state from {state_path}")
                 logger.info(f"State: {json.dumps(state_data.model_dump(), indent=2)}")
 
+            cls._load_cache[adw_id] = state
             return state
         except Exception as e:
             if logger:
@@ -2,34 +2,76 @@
 
 import json
 import logging
+import logging.handlers
 import os
 import re
+import shutil
 import sys
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, TypeVar, Type, Union, Dict, Optional
 
 T = TypeVar('T')
 
+# Resolved once at import; setup_logger runs per workflow entry point.
+_PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
 
 def make_adw_id() -> str:
     """Generate a short 8-character UUID for ADW tracking."""
-    return str(uuid.uuid4())[:8]
+    # .hex skips the dashed str() formatting we'd only slice away
+    return uuid.uuid4().hex[:8]
+
+
+# Buffered file records hit disk at least this often, so tailing
+# execution.log stays useful during long quiet stretches.
+_LOG_FLUSH_INTERVAL_S = 30.0
+
+
+def _start_periodic_flush(handler: logging.Handler) -> None:
+    """Flush the handler every _LOG_FLUSH_INTERVAL_S on a daemon thread."""
+    stop = threading.Event()
+
+    def flush_loop():
+        while not stop.wait(_LOG_FLUSH_INTERVAL_S):
+            handler.flush()
+
+    # Stashed on the handler so a later setup_logger for the same adw_id
+    # can stop this thread before replacing the handler.
+    handler._adw_flush_stop = stop
+    threading.Thread(target=flush_loop, daemon=True, name="adw-log-flush").start()
 
 
 def setup_logger(adw_id: str, trigger_type: str = "adw_plan_build") -> logging.Logger:
     """Set up logger that writes to both console and file using adw_id."""
-    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    log_dir = os.path.join(project_root, "agents", adw_id, trigger_type)
+    log_dir = os.path.join(_PROJECT_ROOT, "agents", adw_id, trigger_type)
     os.makedirs(log_dir, exist_ok=True)
 
     log_file = os.path.join(log_dir, "execution.log")
 
     logger = logging.getLogger(f"adw_{adw_id}")
     logger.setLevel(logging.DEBUG)
+    # setup_logger can run more than once per adw_id; drain and close the
+    # old handlers so already-buffered records land in the file now rather
+    # than out of order at interpreter exit.
+    for handler in logger.handlers:
+        stop = getattr(handler, "_adw_flush_stop", None)
+        if stop is not None:
+            stop.set()
+        handler.flush()
+        handler.close()
     logger.handlers.clear()
 
-    file_handler = logging.FileHandler(log_file, mode='a')
+    # Size-capped rotation: unbounded ADW loops otherwise grow
+    # execution.log without limit and slow anything that tails it
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=10 * 1024 * 1024, backupCount=3, encoding='utf-8'
+    )
     file_handler.setLevel(logging.DEBUG)
 
     console_handler = logging.StreamHandler(sys.stdout)
@@ -44,7 +86,17 @@ def setup_logger(adw_id: str, trigger_type: str = "adw_plan_build") -> logging.L
     file_handler.setFormatter(file_formatter)
     console_handler.setFormatter(console_formatter)
 
-    logger.addHandler(file_handler)
+    # Batch debug-heavy file logging in memory; records hit disk when the
+    # buffer fills, on any ERROR, every 30s via the background flusher, or
+    # at shutdown (logging.shutdown flushes handlers atexit). Console
+    # output stays direct and unbuffered.
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=8192, flushLevel=logging.ERROR, target=file_handler
+    )
+    memory_handler.setLevel(logging.DEBUG)
+    _start_periodic_flush(memory_handler)
+
+    logger.addHandler(memory_handler)
     logger.addHandler(console_handler)
 
     logger.info(f"ADW Logger initialized - ID: {adw_id}")
@@ -58,10 +110,14 @@ def get_logger(adw_id: str) -> logging.Logger:
     return logging.getLogger(f"adw_{adw_id}")
 
 
+# Matches a fenced ```json code block; compiled once since parse_json
+# runs per LLM response.
+_JSON_BLOCK = re.compile(r'```(?:json)?\s*\n(.*?)\n```', re.DOTALL)
+
+
 def parse_json(text: str, target_type: Type[T] = None) -> Union[T, Any]:
     """Parse JSON that may be wrapped in markdown code blocks."""
-    code_block_pattern = r'```(?:json)?\s*\n(.*?)\n```'
-    match = re.search(code_block_pattern, text, re.DOTALL)
+    match = _JSON_BLOCK.search(text)
 
     if match:
         json_str = match.group(1).strip()
@@ -69,15 +125,18 @@ def parse_json(text: str, target_type: Type[T] = None) -> Union[T, Any]:
         json_str = text.strip()
 
     if not (json_str.startswith('[') or json_str.startswith('{')):
+        # Decide array-vs-object from the opening brackets first, then do a
+        # single rfind for the matching closer - two passes instead of four
+        # over what can be a multi-KB model response.
         array_start = json_str.find('[')
-        array_end = json_str.rfind(']')
         obj_start = json_str.find('{')
-        obj_end = json_str.rfind('}')
 
         if array_start != -1 and (obj_start == -1 or array_start < obj_start):
+            array_end = json_str.rfind(']')
             if array_end != -1:
                 json_str = json_str[array_start:array_end + 1]
         elif obj_start != -1:
+            obj_end = json_str.rfind('}')
             if obj_end != -1:
                 json_str = json_str[obj_start:obj_end + 1]
 
@@ -115,6 +174,20 @@ def check_env_vars(logger: Optional[logging.Logger] = None) -> None:
     pass
 
 
+_REQUIRED_TOOLS = {
+    "gh": "GitHub CLI - install from https://cli.github.com/",
+    "git": "Git - install from https://git-scm.com/",
+    "claude": "Claude Code CLI - uses your Max subscription credits",
+}
+
+
+# PATH scans stat every directory entry; tool locations don't change
+# mid-run, so cache the lookups across workflow steps.
+@lru_cache(maxsize=None)
+def _which(tool: str) -> Optional[str]:
+    return shutil.which(tool)
+
+
 def check_required_tools(logger: Optional[logging.Logger] = None) -> None:
     """Check that all required CLI tools are installed.
 
@@ -123,7 +196,6 @@ def check_required_tools(logger: Optional[logging.Logger] = None) -> None:
     - git: Git version control
     - claude: Claude Code CLI (uses your Max subscription credits)
     """
-    import shutil
     import subprocess
 
     def log_error(msg: str) -> None:
@@ -138,31 +210,41 @@ def check_required_tools(logger: Optional[logging.Logger] = None) -> None:
         else:
             print(msg)
 
-    tools = {
-        "gh": "GitHub CLI - install from https://cli.github.com/",
-        "git": "Git - install from https://git-scm.com/",
-        "claude": "Claude Code CLI - uses your Max subscription credits",
-    }
+    # Warm the cache with all probes in flight at once; PATH lookups are
+    # syscall-bound so they overlap cleanly. The gh auth probe (a network
+    # roundtrip) starts on the same pool as soon as gh is located.
+    with ThreadPoolExecutor(max_workers=len(_REQUIRED_TOOLS) + 1) as executor:
+        auth_future = None
+        if _which("gh"):
+            auth_future = executor.submit(
+                subprocess.run,
+                ["gh", "auth", "status"],
+                capture_output=True,
+                text=True,
+                # Matches github.GH_TIMEOUT_S; a literal keeps this module
+                # free of adw_modules imports.
+                timeout=30,
+            )
+        found = list(executor.map(_which, _REQUIRED_TOOLS))
 
     missing_tools = []
-    for tool, description in tools.items():
-        if not shutil.which(tool):
+    for (tool, description), path in zip(_REQUIRED_TOOLS.items(), found):
+        if not path:
             missing_tools.append((tool, description))
 
     # Check gh auth status (only if gh is installed)
-    if shutil.which("gh"):
-        result = subprocess.run(
-            ["gh", "auth", "status"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
+    if auth_future is not None:
+        try:
+            authenticated = auth_future.result().returncode == 0
+        except subprocess.TimeoutExpired:
+            authenticated = False
+        if not authenticated:
             missing_tools.append(("gh auth", "GitHub CLI not authenticated - run: gh auth login"))
         else:
             log_info("✓ GitHub CLI authenticated")
 
     # Check claude CLI
-    if shutil.which("claude"):
+    if _which("claude"):
         log_info("✓ Claude Code CLI found (uses Max subscription credits)")
 
     if missing_tools:
@@ -172,8 +254,25 @@ def check_required_tools(logger: Optional[logging.Logger] = None) -> None:
         sys.exit(1)
 
 
+# Built once; the surrounding environment doesn't change mid-run and the
+# project spawns many subprocesses per ADW. PWD stays per-call below.
+_ENV_CACHE: Optional[Dict[str, str]] = None
+
+
+def invalidate_env_cache() -> None:
+    """Drop the cached subprocess env (e.g. after reloading .env)."""
+    global _ENV_CACHE
+    _ENV_CACHE = None
+
+
 def get_safe_subprocess_env() -> Dict[str, str]:
     """Get filtered environment variables safe for subprocess execution."""
+    global _ENV_CACHE
+    if _ENV_CACHE is not None:
+        env = dict(_ENV_CACHE)
+        env["PWD"] = os.getcwd()
+        return env
+
     safe_env_vars = {
         "ANTHROPIC_API_KEY": os.getenv("ANTHROPIC_API_KEY"),
         "GITHUB_PAT": os.getenv("GITHUB_PAT"),
@@ -192,11 +291,14 @@ def get_safe_subprocess_env() -> Dict[str, str]:
         "LC_ALL": os.getenv("LC_ALL"),
         "PYTHONPATH": os.getenv("PYTHONPATH"),
         "PYTHONUNBUFFERED": "1",
-        "PWD": os.getcwd(),
     }
 
     github_pat = os.getenv("GITHUB_PAT")
     if github_pat:
         safe_env_vars["GH_TOKEN"] = github_pat
 
-    return {k: v for k, v in safe_env_vars.items() if v is not None}
+    _ENV_CACHE = {k: v for k, v in safe_env_vars.items() if v is not None}
+
+    env = dict(_ENV_CACHE)
+    env["PWD"] = os.getcwd()
+    return env
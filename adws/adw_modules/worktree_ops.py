@@ -1,50 +1,102 @@
 """Worktree and port management operations for isolated ADW workflows."""
 
+import atexit
 import os
+import shutil
 import subprocess
 import logging
 import socket
-from typing import Tuple, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Tuple, Optional
+from adw_modules.git_ops import GIT_TIMEOUT_S
 from adw_modules.state import ADWState
 
+# Resolved once at import; every worktree helper needs the repo root.
+_PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+# A sibling worktree created seconds ago already fetched origin; skip the
+# network roundtrip while FETCH_HEAD is younger than this many seconds.
+FETCH_TTL_S = int(os.getenv("ADW_FETCH_TTL", "60"))
+
+
+def _await_fetch(fetch_proc: subprocess.Popen, logger: logging.Logger) -> None:
+    """Reap the overlapped fetch, killing it if it hangs past the timeout."""
+    try:
+        _, fetch_stderr = fetch_proc.communicate(timeout=GIT_TIMEOUT_S)
+        if fetch_proc.returncode != 0:
+            logger.warning(f"Failed to fetch from origin: {fetch_stderr}")
+    except subprocess.TimeoutExpired:
+        fetch_proc.kill()
+        fetch_proc.communicate()
+        logger.warning(f"git fetch timed out after {GIT_TIMEOUT_S}s")
+
+
+def _recently_fetched() -> bool:
+    fetch_head = os.path.join(_PROJECT_ROOT, ".git", "FETCH_HEAD")
+    try:
+        return time.time() - os.path.getmtime(fetch_head) < FETCH_TTL_S
+    except OSError:
+        return False
+
 
 def create_worktree(adw_id: str, branch_name: str, logger: logging.Logger) -> Tuple[str, Optional[str]]:
     """Create a git worktree for isolated ADW execution."""
-    project_root = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
+    trees_dir = os.path.join(_PROJECT_ROOT, "trees")
+    worktree_path = os.path.join(trees_dir, adw_id)
 
-    trees_dir = os.path.join(project_root, "trees")
-    os.makedirs(trees_dir, exist_ok=True)
+    # Kick off the network fetch immediately; directory prep and the
+    # taken-path check run locally while it is in flight.
+    fetch_proc = None
+    if _recently_fetched():
+        logger.info(f"Skipping fetch - origin fetched within the last {FETCH_TTL_S}s")
+    else:
+        logger.info("Fetching latest changes from origin")
+        fetch_proc = subprocess.Popen(
+            ["git", "fetch", "origin"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=_PROJECT_ROOT
+        )
 
-    worktree_path = os.path.join(trees_dir, adw_id)
+    os.makedirs(trees_dir, exist_ok=True)
 
     if os.path.exists(worktree_path):
+        if fetch_proc:
+            _await_fetch(fetch_proc, logger)
         logger.warning(f"Worktree already exists at {worktree_path}")
         return worktree_path, None
 
-    logger.info("Fetching latest changes from origin")
-    fetch_result = subprocess.run(
-        ["git", "fetch", "origin"],
-        capture_output=True,
-        text=True,
-        cwd=project_root
-    )
-    if fetch_result.returncode != 0:
-        logger.warning(f"Failed to fetch from origin: {fetch_result.stderr}")
-
-    cmd = ["git", "worktree", "add", "-b", branch_name, worktree_path, "origin/main"]
-    result = subprocess.run(cmd, capture_output=True, text=True, cwd=project_root)
+    if fetch_proc:
+        _await_fetch(fetch_proc, logger)
 
-    if result.returncode != 0:
-        if "already exists" in result.stderr:
-            cmd = ["git", "worktree", "add", worktree_path, branch_name]
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=project_root)
+    try:
+        cmd = ["git", "worktree", "add", "-b", branch_name, worktree_path, "origin/main"]
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, cwd=_PROJECT_ROOT,
+            timeout=GIT_TIMEOUT_S,
+        )
 
         if result.returncode != 0:
-            error_msg = f"Failed to create worktree: {result.stderr}"
-            logger.error(error_msg)
-            return None, error_msg
+            if "already exists" in result.stderr:
+                cmd = ["git", "worktree", "add", worktree_path, branch_name]
+                result = subprocess.run(
+                    cmd, capture_output=True, text=True, cwd=_PROJECT_ROOT,
+                    timeout=GIT_TIMEOUT_S,
+                )
+
+            if result.returncode != 0:
+                error_msg = f"Failed to create worktree: {result.stderr}"
+                logger.error(error_msg)
+                return None, error_msg
+    except subprocess.TimeoutExpired:
+        error_msg = f"git worktree add timed out after {GIT_TIMEOUT_S}s"
+        logger.error(error_msg)
+        return None, error_msg
 
     logger.info(f"Created worktree at {worktree_path} for branch {branch_name}")
     return worktree_path, None
@@ -59,8 +111,21 @@ def validate_worktree(adw_id: str, state: ADWState) -> Tuple[bool, Optional[str]
     if not os.path.exists(worktree_path):
         return False, f"Worktree directory not found: {worktree_path}"
 
-    result = subprocess.run(["git", "worktree", "list"], capture_output=True, text=True)
-    if worktree_path not in result.stdout:
+    try:
+        result = subprocess.run(
+            ["git", "worktree", "list", "--porcelain"],
+            capture_output=True, text=True, timeout=GIT_TIMEOUT_S,
+        )
+    except subprocess.TimeoutExpired:
+        return False, f"git worktree list timed out after {GIT_TIMEOUT_S}s"
+    # Porcelain output gives one exact "worktree <path>" line per entry;
+    # set membership avoids prefix false positives from substring search.
+    registered = {
+        line[len("worktree "):]
+        for line in result.stdout.splitlines()
+        if line.startswith("worktree ")
+    }
+    if worktree_path not in registered:
         return False, "Worktree not registered with git"
 
     return True, None
@@ -68,29 +133,70 @@ def validate_worktree(adw_id: str, state: ADWState) -> Tuple[bool, Optional[str]
 
 def get_worktree_path(adw_id: str) -> str:
     """Get absolute path to worktree."""
-    project_root = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
-    return os.path.join(project_root, "trees", adw_id)
+    return os.path.join(_PROJECT_ROOT, "trees", adw_id)
+
+
+# Deleting a worktree with node_modules/venv trees can take many seconds;
+# offload the rmtree fallback so teardown returns as soon as git has
+# released its handle on the path.
+_CLEANUP_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="adw-cleanup")
+_CLEANUP_LOCK = threading.Lock()
+_PENDING_CLEANUPS: Dict[str, Future] = {}
+
+
+def _cleanup_done(path: str, future: Future, logger: logging.Logger) -> None:
+    with _CLEANUP_LOCK:
+        _PENDING_CLEANUPS.pop(path, None)
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Background deletion of {path} failed: {error}")
+
+
+def wait_for_cleanup() -> None:
+    """Block until all background worktree deletions have finished.
+
+    Registered atexit so in-flight deletions aren't cut off mid-tree when
+    the process exits; failures are logged by the done-callback.
+    """
+    with _CLEANUP_LOCK:
+        pending = list(_PENDING_CLEANUPS.values())
+    for future in pending:
+        try:
+            future.result()
+        except Exception:
+            pass
+
+
+atexit.register(wait_for_cleanup)
 
 
 def remove_worktree(adw_id: str, logger: logging.Logger) -> Tuple[bool, Optional[str]]:
     """Remove a worktree and clean up."""
-    import shutil
     worktree_path = get_worktree_path(adw_id)
 
     cmd = ["git", "worktree", "remove", worktree_path, "--force"]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
+    try:
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, timeout=GIT_TIMEOUT_S
+        )
+        remove_failed = result.returncode != 0
+    except subprocess.TimeoutExpired:
+        remove_failed = True
+
+    if remove_failed:
         if os.path.exists(worktree_path):
-            try:
-                shutil.rmtree(worktree_path)
-                logger.warning(f"Manually removed worktree directory: {worktree_path}")
-            except Exception as e:
-                return False, f"Failed to remove worktree: {result.stderr}, manual cleanup failed: {e}"
-
-    logger.info(f"Removed worktree at {worktree_path}")
+            with _CLEANUP_LOCK:
+                if worktree_path not in _PENDING_CLEANUPS:
+                    future = _CLEANUP_EXECUTOR.submit(shutil.rmtree, worktree_path)
+                    future.add_done_callback(
+                        lambda f, p=worktree_path, lg=logger: _cleanup_done(p, f, lg)
+                    )
+                    _PENDING_CLEANUPS[worktree_path] = future
+            logger.warning(
+                f"git worktree remove failed, deleting {worktree_path} in background"
+            )
+    else:
+        logger.info(f"Removed worktree at {worktree_path}")
     return True, None
 
 
@@ -98,13 +204,8 @@ def setup_worktree_environment(worktree_path: str, backend_port: int, frontend_p
     """Set up worktree environment by creating .ports.env file and copying .env.local."""
     import shutil
 
-    # Get project root to find .env.local
-    project_root = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
-
     # Copy .env.local from project root to worktree (contains Supabase credentials, etc.)
-    env_local_src = os.path.join(project_root, ".env.local")
+    env_local_src = os.path.join(_PROJECT_ROOT, ".env.local")
     env_local_dst = os.path.join(worktree_path, ".env.local")
     if os.path.exists(env_local_src) and not os.path.exists(env_local_dst):
         shutil.copy2(env_local_src, env_local_dst)
@@ -113,18 +214,29 @@ def setup_worktree_environment(worktree_path: str, backend_port: int, frontend_p
     # Create .ports.env for port configuration
     ports_env_path = os.path.join(worktree_path, ".ports.env")
 
+    # One coalesced write instead of three passes through the I/O stack
+    ports_contents = (
+        f"BACKEND_PORT={backend_port}\n"
+        f"FRONTEND_PORT={frontend_port}\n"
+        f"VITE_BACKEND_URL=http://localhost:{backend_port}\n"
+    )
     with open(ports_env_path, "w") as f:
-        f.write(f"BACKEND_PORT={backend_port}\n")
-        f.write(f"FRONTEND_PORT={frontend_port}\n")
-        f.write(f"VITE_BACKEND_URL=http://localhost:{backend_port}\n")
+        f.write(ports_contents)
 
     logger.info(f"Created .ports.env with Backend: {backend_port}, Frontend: {frontend_port}")
 
 
+# Deletion table dropping ASCII non-alphanumerics in C instead of a
+# per-character Python loop; ADW ids are short hex strings.
+_KEEP_ALNUM = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(128) if not chr(c).isalnum())
+)
+
+
 def get_ports_for_adw(adw_id: str) -> Tuple[int, int]:
     """Deterministically assign ports based on ADW ID."""
     try:
-        id_chars = ''.join(c for c in adw_id[:8] if c.isalnum())
+        id_chars = adw_id[:8].translate(_KEEP_ALNUM)
         index = int(id_chars, 36) % 15
     except ValueError:
         index = hash(adw_id) % 15
@@ -138,25 +250,57 @@ def get_ports_for_adw(adw_id: str) -> Tuple[int, int]:
 def is_port_available(port: int) -> bool:
     """Check if a port is available for binding."""
     try:
+        # bind() on localhost doesn't block, so no timeout is needed
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(1)
             s.bind(('localhost', port))
             return True
     except (socket.error, OSError):
         return False
 
 
+def ports_available(ports: List[int]) -> bool:
+    """Check that every port in the batch is free, in one bind sweep.
+
+    All sockets stay bound until the last probe succeeds, so the check is
+    atomic across the batch - a duplicate or colliding pair can't pass by
+    probing one port at a time.
+    """
+    socks = []
+    try:
+        for port in ports:
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            s.setblocking(False)
+            socks.append(s)
+            s.bind(('localhost', port))
+        return True
+    except (socket.error, OSError):
+        return False
+    finally:
+        for s in socks:
+            s.close()
+
+
 def find_next_available_ports(adw_id: str, max_attempts: int = 15) -> Tuple[int, int]:
-    """Find available ports starting from deterministic assignment."""
+    """Find available ports starting from deterministic assignment.
+
+    All candidate pairs are probed concurrently and the first available
+    pair in deterministic order wins, so the scan costs one socket probe
+    of wall time instead of up to max_attempts.
+    """
     base_backend, base_frontend = get_ports_for_adw(adw_id)
     base_index = base_backend - 9100
 
+    candidates = []
     for offset in range(max_attempts):
         index = (base_index + offset) % 15
-        backend_port = 9100 + index
-        frontend_port = 9200 + index
+        candidates.append((9100 + index, 9200 + index))
+
+    def pair_available(pair: Tuple[int, int]) -> bool:
+        return ports_available(list(pair))
 
-        if is_port_available(backend_port) and is_port_available(frontend_port):
-            return backend_port, frontend_port
+    with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+        for pair, available in zip(candidates, executor.map(pair_available, candidates)):
+            if available:
+                return pair
 
     raise RuntimeError("No available ports in the allocated range")
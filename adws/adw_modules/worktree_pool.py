@@ -0,0 +1,174 @@
+"""Persistent worktree pool for reuse across ADW runs (opt-in).
+
+Creating a worktree pays `git worktree add`, dependency install, and env
+setup on every run. With ADW_USE_WORKTREE_POOL=1, runs instead borrow a
+managed slot (adw-managed-wt-01..N) that survives between runs: acquiring
+a used slot just re-points it at the new branch and hard-resets to
+origin/main. Assignments live in trees/pool.json; releasing a slot keeps
+the directory (and its installed dependencies) for the next run.
+"""
+
+import atexit
+import fcntl
+import json
+import logging
+import os
+import subprocess
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+from adw_modules.git_ops import GIT_TIMEOUT_S
+from adw_modules.worktree_ops import _PROJECT_ROOT, _recently_fetched
+
+POOL_SIZE = int(os.getenv("ADW_WORKTREE_POOL_SIZE", "4"))
+
+_POOL_DIR = os.path.join(_PROJECT_ROOT, "trees")
+_POOL_FILE = os.path.join(_POOL_DIR, "pool.json")
+_POOL_LOCK = threading.Lock()
+
+
+@contextmanager
+def _pool_file_lock():
+    """Serialize pool.json load-modify-save across processes.
+
+    Parallel ADW runs are separate processes, so the in-process lock
+    alone can't stop two runs from grabbing the same free slot; flock on
+    a sidecar lock file covers both. Released automatically if the
+    process dies mid-update.
+    """
+    os.makedirs(_POOL_DIR, exist_ok=True)
+    with open(_POOL_FILE + ".lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def pool_enabled() -> bool:
+    """Whether pooled worktree reuse is enabled via ADW_USE_WORKTREE_POOL=1."""
+    return os.getenv("ADW_USE_WORKTREE_POOL") == "1"
+
+
+def _load_pool() -> dict:
+    try:
+        with open(_POOL_FILE) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"slots": {}}
+
+
+def _save_pool(pool: dict) -> None:
+    os.makedirs(_POOL_DIR, exist_ok=True)
+    # Atomic replace so a concurrent reader never sees a partial file
+    tmp_file = _POOL_FILE + ".tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(pool, f, indent=2)
+    os.replace(tmp_file, _POOL_FILE)
+
+
+def acquire(adw_id: str, branch_name: str, logger: logging.Logger) -> Optional[str]:
+    """Borrow a pool slot for this run; returns the worktree path or None.
+
+    A free existing slot is re-pointed at branch_name and reset to
+    origin/main. If no slot exists yet and the pool has room, a new one
+    is created with --no-track (avoids .git/config.lock contention under
+    parallel runs). Returns None when the pool is exhausted or git fails,
+    in which case the caller should fall back to create_worktree.
+    """
+    with _POOL_LOCK, _pool_file_lock():
+        pool = _load_pool()
+        slots = pool.setdefault("slots", {})
+        slot = next((name for name, owner in slots.items() if not owner), None)
+        if slot is None:
+            if len(slots) >= POOL_SIZE:
+                return None
+            slot = f"adw-managed-wt-{len(slots) + 1:02d}"
+        slots[slot] = adw_id
+        _save_pool(pool)
+
+    # Failed or aborted runs exit through sys.exit without reaching the
+    # explicit release on the merge path; returning the slot at interpreter
+    # exit keeps them from leaking. Idempotent if already released.
+    atexit.register(release, adw_id, None)
+
+    slot_path = os.path.join(_POOL_DIR, slot)
+
+    if not os.path.isdir(slot_path):
+        try:
+            result = subprocess.run(
+                ["git", "worktree", "add", "--no-track", "-b", branch_name,
+                 slot_path, "origin/main"],
+                capture_output=True, text=True, cwd=_PROJECT_ROOT,
+                timeout=GIT_TIMEOUT_S,
+            )
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Timed out creating pool slot {slot}")
+            release(adw_id, logger)
+            return None
+        if result.returncode != 0:
+            logger.warning(f"Failed to create pool slot {slot}: {result.stderr}")
+            release(adw_id, logger)
+            return None
+        logger.info(f"Created pooled worktree {slot} for {adw_id}")
+        return slot_path
+
+    # Reuse skips create_worktree, which is where the non-pooled path
+    # fetches - without one here the slot would branch from a stale
+    # origin/main. Failure is non-fatal, matching create_worktree.
+    if not _recently_fetched():
+        try:
+            result = subprocess.run(
+                ["git", "fetch", "origin"],
+                capture_output=True, text=True, cwd=slot_path,
+                timeout=GIT_TIMEOUT_S,
+            )
+            if result.returncode != 0:
+                logger.warning(f"Failed to fetch from origin: {result.stderr}")
+        except subprocess.TimeoutExpired:
+            logger.warning(f"git fetch timed out after {GIT_TIMEOUT_S}s")
+
+    # Reuse the existing slot: new branch, clean tree, deps left in place.
+    # reset --hard ignores untracked files, so the previous run's leftover
+    # artifacts (TEST_FAILURES.md, stale specs) are cleaned explicitly,
+    # keeping installed deps and env files.
+    for cmd in (
+        ["git", "checkout", "-B", branch_name],
+        ["git", "reset", "--hard", "origin/main"],
+        ["git", "clean", "-fd",
+         "-e", "node_modules", "-e", ".env.local", "-e", ".ports.env"],
+    ):
+        try:
+            result = subprocess.run(
+                cmd, capture_output=True, text=True, cwd=slot_path,
+                timeout=GIT_TIMEOUT_S,
+            )
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Timed out resetting pool slot {slot}")
+            release(adw_id, logger)
+            return None
+        if result.returncode != 0:
+            logger.warning(f"Failed to reset pool slot {slot}: {result.stderr}")
+            release(adw_id, logger)
+            return None
+
+    logger.info(f"Reusing pooled worktree {slot} for {adw_id}")
+    return slot_path
+
+
+def release(adw_id: str, logger: Optional[logging.Logger] = None) -> None:
+    """Return this run's slot to the pool, keeping the directory in place."""
+    with _POOL_LOCK, _pool_file_lock():
+        pool = _load_pool()
+        released = [
+            name for name, owner in pool.get("slots", {}).items() if owner == adw_id
+        ]
+        for name in released:
+            pool["slots"][name] = None
+        if released:
+            _save_pool(pool)
+
+    if logger:
+        for name in released:
+            logger.info(f"Released pooled worktree {name} from {adw_id}")
@@ -23,23 +23,26 @@ This fully automated hybrid workflow uses Claude Code CLI (Max plan credits):
 No API key needed - uses Claude Code CLI which uses your Max plan credits.
 """
 
+import argparse
+import asyncio
+import atexit
 import sys
 import os
 import subprocess
 import logging
-import json
-import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, List
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
 
 # Add the parent directory to Python path to import modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from adw_modules.state import ADWState
-from adw_modules.git_ops import commit_changes, finalize_git_operations, get_current_branch
+from adw_modules.git_ops import GIT_TIMEOUT_S, commit_changes, finalize_git_operations
 from adw_modules.github import (
+    CommentBatcher,
     fetch_issue,
-    make_issue_comment,
     get_repo_url,
     extract_repo_path,
 )
@@ -62,14 +65,17 @@ from adw_modules.worktree_ops import (
     create_worktree,
     validate_worktree,
     get_ports_for_adw,
-    is_port_available,
+    ports_available,
     find_next_available_ports,
     setup_worktree_environment,
 )
+from adw_modules import worktree_pool
 from adw_modules.spec_generator import generate_spec_from_issue, clear_specs_directory
-from adw_modules.r2_uploader import R2Uploader
 
 # Constants
+# Main repo root (parent of adws), resolved once at import
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 MAX_TEST_RETRY_ATTEMPTS = 3
 MAX_BACKPRESSURE_LOOPS = 0  # 0 = unlimited, loop plan->build->test until all tests pass
 DEFAULT_PLAN_ITERATIONS = 0  # 0 = unlimited, iterate until done
@@ -77,48 +83,88 @@ DEFAULT_BUILD_ITERATIONS = 0  # 0 = unlimited, iterate until done
 AGENT_TESTER = "test_runner"
 AGENT_REVIEWER = "reviewer"
 
+# Markers for review-issue severities in posted comments
+_SEVERITY_EMOJI = {"blocker": "🚫", "tech_debt": "⚠️", "skippable": "ℹ️"}
+
 
 def get_main_repo_root() -> str:
     """Get the main repository root directory (parent of adws)."""
-    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return _PROJECT_ROOT
 
 
 def copy_loop_script(worktree_path: str, logger: logging.Logger) -> Tuple[bool, Optional[str]]:
     """Ensure loop.sh exists in worktree and is executable."""
     loop_script = os.path.join(worktree_path, "ralph", "loop.sh")
 
-    if not os.path.exists(loop_script):
-        return False, f"ralph/loop.sh not found in worktree at {loop_script}"
-
+    # chmod doubles as the existence check - one syscall instead of a
+    # stat followed by the chmod
     try:
         os.chmod(loop_script, 0o755)
         logger.info("Verified ralph/loop.sh is executable")
         return True, None
+    except FileNotFoundError:
+        return False, f"ralph/loop.sh not found in worktree at {loop_script}"
     except Exception as e:
         return False, f"Failed to make ralph/loop.sh executable: {e}"
 
 
+def _tee_ralph_output(stream, log_file) -> None:
+    """Forward Ralph output lines to stdout and the phase log file."""
+    for line in stream:
+        sys.stdout.write(line)
+        log_file.write(line)
+
+
 def run_ralph_phase(
     phase: str,
     worktree_path: str,
     max_iterations: int,
     logger: logging.Logger,
+    adw_id: Optional[str] = None,
 ) -> Tuple[bool, Optional[str]]:
-    """Run a Ralph phase (plan or build) in the worktree."""
+    """Run a Ralph phase (plan or build) in the worktree.
+
+    Output is piped and teed: it still reaches the terminal live, but is
+    also captured to agents/{adw_id}/ralph_{phase}.log for post-mortems,
+    and the parent no longer shares stdio buffers with the loop script.
+    """
     loop_script = os.path.join(worktree_path, "ralph", "loop.sh")
     cmd = [loop_script, phase, str(max_iterations)]
     logger.info(f"Running Ralph {phase} phase: {' '.join(cmd)}")
 
+    if adw_id:
+        log_dir = os.path.join(get_main_repo_root(), "agents", adw_id)
+        phase_log_path = os.path.join(log_dir, f"ralph_{phase}.log")
+        os.makedirs(log_dir, exist_ok=True)
+    else:
+        phase_log_path = os.devnull
+
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=worktree_path,
-            capture_output=False,
-            text=True,
-        )
+        with open(phase_log_path, "a") as phase_log:
+            proc = subprocess.Popen(
+                cmd,
+                cwd=worktree_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                # Strict decoding would raise inside the tee thread on one
+                # invalid byte, the pipe would fill, and proc.wait() would
+                # hang forever - Ralph output isn't guaranteed clean UTF-8.
+                errors="replace",
+                bufsize=1,
+            )
+            reader = threading.Thread(
+                target=_tee_ralph_output, args=(proc.stdout, phase_log), daemon=True
+            )
+            reader.start()
+            proc.wait()
+            # The tee drains until EOF, which arrives once the process
+            # exits; the bounded join is belt-and-braces so a wedged
+            # reader can't hang the workflow (the thread is a daemon).
+            reader.join(timeout=30)
 
-        if result.returncode != 0:
-            return False, f"Ralph {phase} phase exited with code {result.returncode}"
+        if proc.returncode != 0:
+            return False, f"Ralph {phase} phase exited with code {proc.returncode}"
 
         logger.info(f"Ralph {phase} phase completed successfully")
         return True, None
@@ -144,7 +190,7 @@ def run_tests(
     response = execute_template(test_request)
 
     if not response.success:
-        logger.error(f"Test execution failed: {response.output}")
+        logger.error("Test execution failed: %s", response.output)
         return [], 0, 0
 
     try:
@@ -159,12 +205,19 @@ def run_tests(
 
 def find_screenshots_in_dir(review_img_dir: str, logger: logging.Logger) -> List[str]:
     """Find all PNG screenshots in the review image directory."""
-    screenshots = []
-    if os.path.exists(review_img_dir):
-        for f in sorted(os.listdir(review_img_dir)):
-            if f.endswith('.png'):
-                screenshots.append(os.path.join(review_img_dir, f))
-        logger.info(f"Found {len(screenshots)} screenshots in {review_img_dir}")
+    # Single scandir pass: dirents carry type info and full paths, so only
+    # the matching PNGs get sorted. A missing dir just means no screenshots.
+    try:
+        with os.scandir(review_img_dir) as entries:
+            screenshots = sorted(
+                entry.path
+                for entry in entries
+                if entry.name.endswith('.png') and entry.is_file()
+            )
+    except FileNotFoundError:
+        return []
+
+    logger.info(f"Found {len(screenshots)} screenshots in {review_img_dir}")
     return screenshots
 
 
@@ -179,7 +232,7 @@ def capture_screenshots(
     The script will start the dev server if not running, capture screenshots,
     and stop the server if it started it.
     """
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    project_root = _PROJECT_ROOT
     review_img_dir = os.path.join(project_root, "agents", adw_id, AGENT_REVIEWER, "review_img")
     capture_script = os.path.join(project_root, "adws", "capture_screenshots.py")
 
@@ -199,9 +252,9 @@ def capture_screenshots(
             timeout=180,  # 3 minutes to allow server startup
             cwd=project_root,
         )
-        logger.info(f"Screenshot capture output: {result.stdout}")
+        logger.info("Screenshot capture output: %s", result.stdout)
         if result.returncode != 0:
-            logger.warning(f"Screenshot capture failed: {result.stderr}")
+            logger.warning("Screenshot capture failed: %s", result.stderr)
     except Exception as e:
         logger.error(f"Error capturing screenshots: {e}")
 
@@ -226,7 +279,7 @@ def run_review(
     response = execute_template(request)
 
     # Expected screenshot directory
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    project_root = _PROJECT_ROOT
     review_img_dir = os.path.join(project_root, "agents", adw_id, AGENT_REVIEWER, "review_img")
 
     if not response.success:
@@ -248,7 +301,9 @@ def run_review(
         return result
     except Exception as e:
         logger.error(f"Error parsing review result: {e}")
-        logger.debug(f"Raw output: {response.output[:1000]}")
+        # %.1000s truncates lazily - no slice or format work unless a
+        # DEBUG handler actually emits the record
+        logger.debug("Raw output: %.1000s", response.output)
         # Try to find screenshots even if parsing failed
         screenshots = find_screenshots_in_dir(review_img_dir, logger)
         # Extract summary from output if possible
@@ -272,27 +327,35 @@ def upload_screenshots(
     if not review_result.screenshots:
         return
 
+    # Imported lazily so --skip-review runs never pay the boto3 cold start
+    from adw_modules.r2_uploader import R2Uploader
+
     logger.info(f"Uploading {len(review_result.screenshots)} screenshots")
     uploader = R2Uploader(logger)
-    screenshot_urls = []
 
-    for local_path in review_result.screenshots:
-        abs_path = os.path.join(worktree_path, local_path) if not os.path.isabs(local_path) else local_path
+    # Invariant across the batch; built once instead of per screenshot
+    remote_prefix = f"adw/{adw_id}/review/"
+
+    def upload_one(local_path: str) -> Optional[str]:
+        abs_path = local_path if os.path.isabs(local_path) else os.path.join(worktree_path, local_path)
 
         if not os.path.exists(abs_path):
             logger.warning(f"Screenshot not found: {abs_path}")
-            continue
+            return None
 
-        remote_path = f"adw/{adw_id}/review/{os.path.basename(local_path)}"
-        url = uploader.upload_file(abs_path, remote_path)
+        url = uploader.upload_file(abs_path, remote_prefix + os.path.basename(local_path))
 
         if url:
-            screenshot_urls.append(url)
             logger.info(f"Uploaded: {url}")
-        else:
-            screenshot_urls.append(local_path)
+            return url
+        return local_path
+
+    # Each PUT is network-bound, so uploads run concurrently; zipping
+    # against the input list keeps the original screenshot order.
+    with ThreadPoolExecutor(max_workers=min(8, len(review_result.screenshots))) as executor:
+        results = executor.map(upload_one, review_result.screenshots)
 
-    review_result.screenshot_urls = screenshot_urls
+    review_result.screenshot_urls = [url for url in results if url is not None]
 
 
 def build_review_comment(review_result: ReviewResult) -> str:
@@ -306,99 +369,122 @@ def build_review_comment(review_result: ReviewResult) -> str:
             severity = getattr(issue, "issue_severity", "unknown")
             description = getattr(issue, "issue_description", "No description")
             resolution = getattr(issue, "issue_resolution", "")
-            severity_emoji = {"blocker": "🚫", "tech_debt": "⚠️", "skippable": "ℹ️"}.get(
-                severity, "•"
-            )
-            parts.append(f"{severity_emoji} **{severity.upper()}**: {description}")
+            severity_emoji = _SEVERITY_EMOJI.get(severity, "•")
+            block = f"{severity_emoji} **{severity.upper()}**: {description}"
             if resolution:
-                parts.append(f"   - Resolution: {resolution}")
+                block += f"\n   - Resolution: {resolution}"
+            parts.append(block)
 
     # Add screenshots
     if review_result.screenshot_urls:
         parts.append("\n## Screenshots\n")
-        for i, url in enumerate(review_result.screenshot_urls):
-            if url.startswith("http"):
-                parts.append(f"### Screenshot {i+1}")
-                parts.append(f"![Screenshot {i+1}]({url})\n")
-            else:
-                parts.append(f"- Screenshot {i+1}: `{url}` (upload failed)")
+        parts.extend(
+            f"### Screenshot {i+1}\n![Screenshot {i+1}]({url})\n"
+            if url.startswith("http")
+            else f"- Screenshot {i+1}: `{url}` (upload failed)"
+            for i, url in enumerate(review_result.screenshot_urls)
+        )
     elif review_result.screenshots:
         parts.append("\n## Screenshots\n")
         parts.append("_Screenshots were captured but could not be uploaded. Local paths:_")
-        for path in review_result.screenshots:
-            parts.append(f"- `{path}`")
+        parts.extend(f"- `{path}`" for path in review_result.screenshots)
 
     return "\n".join(parts)
 
 
-def merge_to_main(branch_name: str, logger: logging.Logger) -> Tuple[bool, Optional[str]]:
+async def _run_git(
+    *cmd: str, cwd: str, discard_stdout: bool = False, timeout: float = GIT_TIMEOUT_S
+) -> Tuple[int, bytes, bytes]:
+    """Run a git/gh command without the fork+exec bookkeeping of subprocess.run.
+
+    Streams come back as bytes so the happy path skips decoding entirely;
+    callers decode stderr only inside their error branches. Pass
+    discard_stdout=True for commands whose output is never read. On
+    timeout the process is killed and reaped, and a nonzero returncode
+    with a descriptive stderr is returned.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdout=asyncio.subprocess.DEVNULL if discard_stdout else asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return -1, b"", f"Command timed out after {timeout}s: {' '.join(cmd)}".encode()
+    return proc.returncode, stdout or b"", stderr or b""
+
+
+async def merge_to_main_async(branch_name: str, logger: logging.Logger) -> Tuple[bool, Optional[str]]:
     """Merge feature branch to main and push."""
     repo_root = get_main_repo_root()
     logger.info(f"Merging {branch_name} to main in {repo_root}")
 
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True, text=True, cwd=repo_root
+        # Fetch is a network roundtrip independent of reading the current
+        # branch, so both run concurrently.
+        (_, branch_out, _), _ = await asyncio.gather(
+            _run_git("git", "rev-parse", "--abbrev-ref", "HEAD", cwd=repo_root),
+            _run_git("git", "fetch", "origin", cwd=repo_root, discard_stdout=True),
         )
-        original_branch = result.stdout.strip()
+        original_branch = branch_out.decode().strip()
 
-        subprocess.run(["git", "fetch", "origin"], cwd=repo_root, capture_output=True)
-
-        result = subprocess.run(
-            ["git", "checkout", "main"],
-            capture_output=True, text=True, cwd=repo_root
+        rc, _, stderr = await _run_git(
+            "git", "checkout", "main", cwd=repo_root, discard_stdout=True
         )
-        if result.returncode != 0:
-            return False, f"Failed to checkout main: {result.stderr}"
+        if rc != 0:
+            return False, f"Failed to checkout main: {stderr.decode(errors='replace')}"
 
-        result = subprocess.run(
-            ["git", "pull", "origin", "main"],
-            capture_output=True, text=True, cwd=repo_root
+        rc, _, stderr = await _run_git(
+            "git", "pull", "origin", "main", cwd=repo_root, discard_stdout=True
         )
-        if result.returncode != 0:
-            subprocess.run(["git", "checkout", original_branch], cwd=repo_root)
-            return False, f"Failed to pull main: {result.stderr}"
-
-        result = subprocess.run(
-            ["git", "merge", branch_name, "--no-ff", "-m", f"Merge '{branch_name}' via ADW Ralph workflow"],
-            capture_output=True, text=True, cwd=repo_root
+        if rc != 0:
+            await _run_git("git", "checkout", original_branch, cwd=repo_root, discard_stdout=True)
+            return False, f"Failed to pull main: {stderr.decode(errors='replace')}"
+
+        rc, _, merge_stderr_raw = await _run_git(
+            "git", "merge", branch_name, "--no-ff",
+            "-m", f"Merge '{branch_name}' via ADW Ralph workflow",
+            cwd=repo_root, discard_stdout=True,
         )
-        if result.returncode != 0:
-            stderr_lower = result.stderr.lower()
+        if rc != 0:
+            merge_stderr = merge_stderr_raw.decode(errors='replace')
+            stderr_lower = merge_stderr.lower()
             is_conflict = "conflict" in stderr_lower or "automatic merge failed" in stderr_lower
 
             # Abort the failed local merge
-            subprocess.run(["git", "merge", "--abort"], cwd=repo_root, capture_output=True)
-            subprocess.run(["git", "checkout", original_branch], cwd=repo_root, capture_output=True)
+            await _run_git("git", "merge", "--abort", cwd=repo_root, discard_stdout=True)
+            await _run_git("git", "checkout", original_branch, cwd=repo_root, discard_stdout=True)
 
             if is_conflict:
                 # Retry via GitHub's merge API which can handle simple conflicts
                 logger.info("Local merge failed with conflicts, attempting GitHub PR merge...")
-                gh_result = subprocess.run(
-                    ["gh", "pr", "merge", branch_name, "--merge",
-                     "--subject", f"Merge '{branch_name}' via ADW Ralph workflow"],
-                    capture_output=True, text=True, cwd=repo_root
+                gh_rc, _, _ = await _run_git(
+                    "gh", "pr", "merge", branch_name, "--merge",
+                    "--subject", f"Merge '{branch_name}' via ADW Ralph workflow",
+                    cwd=repo_root, discard_stdout=True,
                 )
-                if gh_result.returncode == 0:
+                if gh_rc == 0:
                     # Pull the merged main locally
-                    subprocess.run(["git", "checkout", "main"], cwd=repo_root, capture_output=True)
-                    subprocess.run(["git", "pull", "origin", "main"], cwd=repo_root, capture_output=True)
+                    await _run_git("git", "checkout", "main", cwd=repo_root, discard_stdout=True)
+                    await _run_git("git", "pull", "origin", "main", cwd=repo_root, discard_stdout=True)
                     logger.info("Merged via GitHub PR merge and pulled to local main")
                     return True, None
 
                 logger.info("GitHub PR merge also failed, falling back to manual review")
-                return False, f"Merge conflicts could not be auto-resolved: {result.stderr}"
+                return False, f"Merge conflicts could not be auto-resolved: {merge_stderr}"
 
-            return False, f"Failed to merge: {result.stderr}"
+            return False, f"Failed to merge: {merge_stderr}"
 
-        result = subprocess.run(
-            ["git", "push", "origin", "main"],
-            capture_output=True, text=True, cwd=repo_root
+        rc, _, stderr = await _run_git(
+            "git", "push", "origin", "main", cwd=repo_root, discard_stdout=True
         )
-        if result.returncode != 0:
-            subprocess.run(["git", "checkout", original_branch], cwd=repo_root)
-            return False, f"Failed to push: {result.stderr}"
+        if rc != 0:
+            await _run_git("git", "checkout", original_branch, cwd=repo_root, discard_stdout=True)
+            return False, f"Failed to push: {stderr.decode(errors='replace')}"
 
         logger.info("Merged and pushed to main, staying on main branch")
         return True, None
@@ -407,6 +493,11 @@ def merge_to_main(branch_name: str, logger: logging.Logger) -> Tuple[bool, Optio
         return False, str(e)
 
 
+def merge_to_main(branch_name: str, logger: logging.Logger) -> Tuple[bool, Optional[str]]:
+    """Synchronous wrapper around merge_to_main_async."""
+    return asyncio.run(merge_to_main_async(branch_name, logger))
+
+
 def main():
     """Main entry point."""
     load_dotenv()
@@ -415,29 +506,30 @@ def main():
     check_env_vars()
     check_required_tools()
 
-    if len(sys.argv) < 2:
-        print("Usage: uv run adw_ralph_iso.py <issue-number> [adw-id] [--plan-iterations N] [--build-iterations N] [--skip-tests] [--skip-review]")
-        sys.exit(1)
-
-    issue_number = sys.argv[1]
-    adw_id = None
-    plan_iterations = DEFAULT_PLAN_ITERATIONS
-    build_iterations = DEFAULT_BUILD_ITERATIONS
-    skip_tests = "--skip-tests" in sys.argv
-    skip_review = "--skip-review" in sys.argv
-
-    args = [a for a in sys.argv[2:] if not a.startswith("--")]
-    if args:
-        adw_id = args[0]
-
-    for i, arg in enumerate(sys.argv):
-        if arg == "--plan-iterations" and i + 1 < len(sys.argv):
-            plan_iterations = int(sys.argv[i + 1])
-        if arg == "--build-iterations" and i + 1 < len(sys.argv):
-            build_iterations = int(sys.argv[i + 1])
-        # Legacy support for --max-iterations (maps to build)
-        if arg == "--max-iterations" and i + 1 < len(sys.argv):
-            build_iterations = int(sys.argv[i + 1])
+    # One argparse pass instead of repeated sys.argv scans; also keeps an
+    # option value from being mistaken for the adw_id positional.
+    parser = argparse.ArgumentParser(
+        prog="adw_ralph_iso.py",
+        description="Fully automated ADW+Ralph workflow",
+    )
+    parser.add_argument("issue_number", metavar="issue-number")
+    parser.add_argument("adw_id", metavar="adw-id", nargs="?", default=None)
+    parser.add_argument("--plan-iterations", type=int, default=DEFAULT_PLAN_ITERATIONS)
+    parser.add_argument("--build-iterations", type=int, default=DEFAULT_BUILD_ITERATIONS)
+    # Legacy alias for --build-iterations
+    parser.add_argument("--max-iterations", type=int, default=None)
+    parser.add_argument("--skip-tests", action="store_true")
+    parser.add_argument("--skip-review", action="store_true")
+    cli_args = parser.parse_args()
+
+    issue_number = cli_args.issue_number
+    adw_id = cli_args.adw_id
+    plan_iterations = cli_args.plan_iterations
+    build_iterations = cli_args.build_iterations
+    if cli_args.max_iterations is not None:
+        build_iterations = cli_args.max_iterations
+    skip_tests = cli_args.skip_tests
+    skip_review = cli_args.skip_review
 
     temp_logger = setup_logger(adw_id, "adw_ralph_iso") if adw_id else None
     adw_id = ensure_adw_id(issue_number, adw_id, temp_logger)
@@ -462,65 +554,72 @@ def main():
         logger.error(f"Error getting repository URL: {e}")
         sys.exit(1)
 
-    # Check/create worktree
+    # Check/create worktree. The whole setup stretch (ports, issue,
+    # classification, branch, worktree) updates state several times; the
+    # transaction coalesces those JSON rewrites into one save on exit.
     valid, error = validate_worktree(adw_id, state)
-    if valid:
-        logger.info(f"Using existing worktree for {adw_id}")
-        worktree_path = state.get("worktree_path")
-        backend_port = state.get("backend_port")
-        frontend_port = state.get("frontend_port")
-    else:
-        backend_port, frontend_port = get_ports_for_adw(adw_id)
-        if not (is_port_available(backend_port) and is_port_available(frontend_port)):
-            backend_port, frontend_port = find_next_available_ports(adw_id)
-
-        logger.info(f"Allocated ports - Backend: {backend_port}, Frontend: {frontend_port}")
-        state.update(backend_port=backend_port, frontend_port=frontend_port)
-        state.save("adw_ralph_iso")
-        worktree_path = None
-
-    # Fetch issue
-    issue: GitHubIssue = fetch_issue(issue_number, repo_path)
-    state.update(issue_number=issue_number)
-    state.save("adw_ralph_iso")
+    with state.transaction("adw_ralph_iso"):
+        if valid:
+            logger.info(f"Using existing worktree for {adw_id}")
+            worktree_path = state.get("worktree_path")
+            backend_port = state.get("backend_port")
+            frontend_port = state.get("frontend_port")
+        else:
+            backend_port, frontend_port = get_ports_for_adw(adw_id)
+            if not ports_available([backend_port, frontend_port]):
+                backend_port, frontend_port = find_next_available_ports(adw_id)
+
+            logger.info(f"Allocated ports - Backend: {backend_port}, Frontend: {frontend_port}")
+            state.update(backend_port=backend_port, frontend_port=frontend_port)
+            worktree_path = None
+
+        # Fetch issue
+        issue: GitHubIssue = fetch_issue(issue_number, repo_path)
+        state.update(issue_number=issue_number)
+
+        # Progress updates are buffered and posted once per phase boundary
+        # instead of one API call per message. The error paths below bail
+        # via sys.exit between flushes; flushing at exit posts whatever is
+        # still queued (no-op when the workflow flushed everything itself).
+        batcher = CommentBatcher(issue_number)
+        atexit.register(batcher.flush)
+        batcher.add(
+            format_issue_message(adw_id, "ops", "Starting fully automated ADW+Ralph workflow\n"
+                               "Pipeline: Plan -> Build -> Test -> Review -> Ship -> Pull")
+        )
 
-    make_issue_comment(
-        issue_number,
-        format_issue_message(adw_id, "ops", "Starting fully automated ADW+Ralph workflow\n"
-                           "Pipeline: Plan -> Build -> Test -> Review -> Ship -> Pull")
-    )
+        # Classify issue
+        issue_command, error = classify_issue(issue, adw_id, logger)
+        if error:
+            logger.error(f"Error classifying issue: {error}")
+            sys.exit(1)
 
-    # Classify issue
-    issue_command, error = classify_issue(issue, adw_id, logger)
-    if error:
-        logger.error(f"Error classifying issue: {error}")
-        sys.exit(1)
+        state.update(issue_class=issue_command)
 
-    state.update(issue_class=issue_command)
-    state.save("adw_ralph_iso")
+        # Generate branch name
+        branch_name, error = generate_branch_name(issue, issue_command, adw_id, logger)
+        if error:
+            logger.error(f"Error generating branch name: {error}")
+            sys.exit(1)
 
-    # Generate branch name
-    branch_name, error = generate_branch_name(issue, issue_command, adw_id, logger)
-    if error:
-        logger.error(f"Error generating branch name: {error}")
-        sys.exit(1)
+        state.update(branch_name=branch_name)
 
-    state.update(branch_name=branch_name)
-    state.save("adw_ralph_iso")
+        # Create worktree if needed; a pooled slot (reused across runs, deps
+        # already installed) is tried first when the pool is enabled
+        if not valid:
+            if worktree_pool.pool_enabled():
+                worktree_path = worktree_pool.acquire(adw_id, branch_name, logger)
 
-    # Create worktree if needed
-    if not valid:
-        worktree_path, error = create_worktree(adw_id, branch_name, logger)
-        if error:
-            logger.error(f"Error creating worktree: {error}")
-            sys.exit(1)
+            if not worktree_path:
+                worktree_path, error = create_worktree(adw_id, branch_name, logger)
+                if error:
+                    logger.error(f"Error creating worktree: {error}")
+                    sys.exit(1)
 
-        state.update(worktree_path=worktree_path)
-        state.save("adw_ralph_iso")
-        setup_worktree_environment(worktree_path, backend_port, frontend_port, logger)
+            state.update(worktree_path=worktree_path)
+            setup_worktree_environment(worktree_path, backend_port, frontend_port, logger)
 
-    make_issue_comment(
-        issue_number,
+    batcher.add(
         format_issue_message(adw_id, "ops", f"Worktree ready\n"
                            f"Branch: `{branch_name}`\n"
                            f"Ports: {backend_port}/{frontend_port}")
@@ -540,23 +639,24 @@ def main():
         logger.error(f"Error generating spec: {error}")
         sys.exit(1)
 
-    make_issue_comment(
-        issue_number,
+    batcher.add(
         format_issue_message(adw_id, "ops", f"Spec generated: `{spec_file}`")
     )
 
     # Remove existing plan for fresh planning
     plan_file = os.path.join(worktree_path, "IMPLEMENTATION_PLAN.md")
-    if os.path.exists(plan_file):
+    try:
         os.remove(plan_file)
+    except FileNotFoundError:
+        pass
 
     # === RALPH PLAN ===
-    make_issue_comment(
-        issue_number,
+    batcher.add(
         format_issue_message(adw_id, "ralph", f"Starting planning phase ({plan_iterations} iterations)...")
     )
+    batcher.flush()
 
-    success, error = run_ralph_phase("plan", worktree_path, plan_iterations, logger)
+    success, error = run_ralph_phase("plan", worktree_path, plan_iterations, logger, adw_id)
     if not success:
         logger.error(f"Ralph planning failed: {error}")
         sys.exit(1)
@@ -568,8 +668,7 @@ def main():
     state.update(plan_file="IMPLEMENTATION_PLAN.md")
     state.save("adw_ralph_iso")
 
-    make_issue_comment(
-        issue_number,
+    batcher.add(
         format_issue_message(adw_id, "ralph", "Planning complete")
     )
 
@@ -582,12 +681,12 @@ def main():
         backpressure_loop += 1
         loop_label = f"loop {backpressure_loop}" if MAX_BACKPRESSURE_LOOPS == 0 else f"loop {backpressure_loop}/{MAX_BACKPRESSURE_LOOPS}"
 
-        make_issue_comment(
-            issue_number,
+        batcher.add(
             format_issue_message(adw_id, "ralph", f"Building ({loop_label})...")
         )
+        batcher.flush()
 
-        success, error = run_ralph_phase("build", worktree_path, build_iterations, logger)
+        success, error = run_ralph_phase("build", worktree_path, build_iterations, logger, adw_id)
         if not success:
             logger.warning(f"Ralph build had issues: {error}")
 
@@ -603,16 +702,14 @@ def main():
         all_tests_passed = failed == 0
 
         if all_tests_passed:
-            make_issue_comment(
-                issue_number,
+            batcher.add(
                 format_issue_message(adw_id, AGENT_TESTER, f"All {passed} tests passed!")
             )
             break
 
         # Check if we've hit the max (0 = unlimited)
         if MAX_BACKPRESSURE_LOOPS != 0 and backpressure_loop >= MAX_BACKPRESSURE_LOOPS:
-            make_issue_comment(
-                issue_number,
+            batcher.add(
                 format_issue_message(adw_id, "ops", f"Reached max backpressure loops ({MAX_BACKPRESSURE_LOOPS}). Moving on with failures.")
             )
             break
@@ -623,73 +720,104 @@ def main():
             f"- **{t.test_name}**: {t.error or 'unknown error'}" for t in failed_tests
         )
 
-        make_issue_comment(
-            issue_number,
+        batcher.add(
             format_issue_message(adw_id, "ops",
                 f"Tests failed ({failed} failures). Re-planning to fix:\n\n{failure_summary}\n\n"
                 "Running plan phase to address failures, then re-building...")
         )
+        batcher.flush()
 
-        # Write test failures to a file so the plan phase can see them
+        # Write test failures to a file so the plan phase can see them;
+        # built in memory and flushed with one write
         failures_file = os.path.join(worktree_path, "TEST_FAILURES.md")
+        failures_content = (
+            f"# Test Failures (Backpressure Loop {backpressure_loop})\n\n"
+            f"The following {failed} test(s) failed and need to be fixed:\n\n"
+        ) + "".join(
+            f"## {t.test_name}\n"
+            f"- **Command**: `{t.execution_command}`\n"
+            f"- **Purpose**: {t.test_purpose}\n"
+            f"- **Error**: {t.error or 'unknown'}\n\n"
+            for t in failed_tests
+        )
         with open(failures_file, "w") as f:
-            f.write(f"# Test Failures (Backpressure Loop {backpressure_loop})\n\n")
-            f.write(f"The following {failed} test(s) failed and need to be fixed:\n\n")
-            for t in failed_tests:
-                f.write(f"## {t.test_name}\n")
-                f.write(f"- **Command**: `{t.execution_command}`\n")
-                f.write(f"- **Purpose**: {t.test_purpose}\n")
-                f.write(f"- **Error**: {t.error or 'unknown'}\n\n")
+            f.write(failures_content)
 
         # Re-run plan phase to address failures
-        success, error = run_ralph_phase("plan", worktree_path, plan_iterations, logger)
+        success, error = run_ralph_phase("plan", worktree_path, plan_iterations, logger, adw_id)
         if not success:
             logger.warning(f"Ralph re-planning had issues: {error}")
 
         # Clean up failures file after planning
-        if os.path.exists(failures_file):
+        try:
             os.remove(failures_file)
+        except FileNotFoundError:
+            pass
+
+        # If re-planning touched nothing, another build+test cycle will
+        # fail identically - bail out instead of burning minutes on a
+        # no-op iteration. status --porcelain also reports newly created
+        # untracked files, which diff HEAD is blind to.
+        try:
+            status_result = subprocess.run(
+                ["git", "status", "--porcelain"],
+                capture_output=True, text=True, cwd=worktree_path,
+                timeout=GIT_TIMEOUT_S,
+            )
+            replanning_changed_nothing = not status_result.stdout.strip()
+        except subprocess.TimeoutExpired:
+            logger.warning(f"git status timed out after {GIT_TIMEOUT_S}s")
+            # Can't tell whether re-planning changed anything; keep looping.
+            replanning_changed_nothing = False
+        if replanning_changed_nothing:
+            logger.warning("Re-planning produced no changes, aborting backpressure loop")
+            batcher.add(
+                format_issue_message(adw_id, "ops",
+                    "Re-planning produced no changes for the failing tests. "
+                    "Moving on with failures.")
+            )
+            break
 
     # === REVIEW WITH SCREENSHOTS ===
     if not skip_review:
-        make_issue_comment(
-            issue_number,
-            format_issue_message(adw_id, AGENT_REVIEWER, "Running code review...")
+        batcher.add(
+            format_issue_message(adw_id, AGENT_REVIEWER,
+                                 "Running code review and capturing screenshots...")
         )
+        batcher.flush()
 
         spec_file_for_review = find_spec_file(state, logger)
-        review_result = None
 
-        if spec_file_for_review:
-            review_result = run_review(spec_file_for_review, adw_id, logger, worktree_path)
-        else:
-            logger.warning("Could not find spec file for review")
-            review_result = ReviewResult(
-                success=True,
-                review_summary="No spec file found for detailed review",
-                review_issues=[],
-                screenshots=[],
-                screenshot_urls=[],
-            )
-
-        # Capture screenshots LAST (after review is complete, showing final state)
-        make_issue_comment(
-            issue_number,
-            format_issue_message(adw_id, AGENT_REVIEWER, "Capturing final screenshots...")
-        )
-
-        # Get port from worktree's .ports.env or use default
+        # Get port from worktree's .ports.env or use default; dotenv_values
+        # parses the file in one pass and tolerates a missing file
         ports_env = os.path.join(worktree_path, ".ports.env")
-        port = "5173"
-        if os.path.exists(ports_env):
-            with open(ports_env) as f:
-                for line in f:
-                    if line.startswith("FRONTEND_PORT="):
-                        port = line.strip().split("=")[1]
-                        break
+        port = dotenv_values(ports_env).get("FRONTEND_PORT") or "5173"
         logger.info(f"Using port {port} for screenshots")
 
-        screenshots = capture_screenshots(adw_id, port, worktree_path, logger)
+        # Review reads the spec and code while the capture script pokes the
+        # dev server - independent work writing to disjoint paths under
+        # agents/{adw_id}/reviewer/, so both run concurrently and the
+        # screenshot timeout hides behind the review agent's runtime
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            shots_future = executor.submit(
+                capture_screenshots, adw_id, port, worktree_path, logger
+            )
+            if spec_file_for_review:
+                review_future = executor.submit(
+                    run_review, spec_file_for_review, adw_id, logger, worktree_path
+                )
+                review_result = review_future.result()
+            else:
+                logger.warning("Could not find spec file for review")
+                review_result = ReviewResult(
+                    success=True,
+                    review_summary="No spec file found for detailed review",
+                    review_issues=[],
+                    screenshots=[],
+                    screenshot_urls=[],
+                )
+            screenshots = shots_future.result()
+
         logger.info(f"Captured {len(screenshots)} screenshots")
 
         # Add screenshots to the review result
@@ -701,43 +829,40 @@ def main():
 
         # Post review with screenshots
         review_comment = build_review_comment(review_result)
-        make_issue_comment(
-            issue_number,
+        batcher.add(
             format_issue_message(adw_id, AGENT_REVIEWER, review_comment)
         )
 
     # === FINALIZE: PUSH AND CREATE PR ===
-    make_issue_comment(
-        issue_number,
+    batcher.add(
         format_issue_message(adw_id, "ops", "Pushing changes and creating PR...")
     )
+    batcher.flush()
 
     finalize_git_operations(state, logger, cwd=worktree_path)
 
     # === SHIP: MERGE TO MAIN ===
-    make_issue_comment(
-        issue_number,
+    batcher.add(
         format_issue_message(adw_id, "ops", "Shipping: merging to main...")
     )
 
     success, error = merge_to_main(branch_name, logger)
     if success:
-        make_issue_comment(
-            issue_number,
+        if worktree_pool.pool_enabled():
+            worktree_pool.release(adw_id, logger)
+        batcher.add(
             format_issue_message(adw_id, "ops", "**Merged to main!**\n\n"
                                "Your localhost should hot-reload with the changes.\n"
                                "If not, the changes are now on your local `main` branch.")
         )
     else:
-        make_issue_comment(
-            issue_number,
+        batcher.add(
             format_issue_message(adw_id, "ops", f"Could not auto-merge: {error}\n"
                                "PR has been created for manual review.")
         )
 
     # === COMPLETE ===
-    make_issue_comment(
-        issue_number,
+    batcher.add(
         format_issue_message(adw_id, "ops",
                            f"**ADW+Ralph workflow completed!**\n\n"
                            f"- Branch: `{branch_name}`\n"
@@ -746,6 +871,7 @@ def main():
                            f"- Tests: {'Passed' if all_tests_passed else 'Some failures'}\n"
                            f"- Shipped: {'Yes' if success else 'PR created'}")
     )
+    batcher.flush()
 
     state.save("adw_ralph_iso")
 